@@ -7,6 +7,8 @@ Each agent is a specialized processor in the content creation pipeline.
 import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+
+import orjson
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
@@ -573,16 +575,15 @@ async def fact_checker_agent(state: MayaState, config: AgentConfig = None) -> Di
             # Try to parse as JSON
             content = response.content.strip()
             if content.startswith("["):
-                import json
                 try:
-                    claims = json.loads(content)
+                    claims = orjson.loads(content)
                     verification_reports[segment_name] = {
                         "claims_found": len(claims),
                         "claims": claims,
                         "confidence": 1.0 if not claims else 0.8,
                     }
                     all_flagged_claims.extend(claims)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     verification_reports[segment_name] = {
                         "claims_found": 0,
                         "raw_response": content,
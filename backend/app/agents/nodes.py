@@ -7,6 +7,8 @@ Each node follows the pattern:
 
 import asyncio
 from typing import Dict, Any, List, Optional
+
+import orjson
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
@@ -22,13 +24,16 @@ from .prompts import (
     get_business_news_prompt,
     get_ai_tech_news_prompt,
     get_caption_prompt,
-    CATEGORIZATION_PROMPT,
+    BATCH_CATEGORIZATION_PROMPT,
     RELEVANCE_PROMPT,
 )
 from .state import MayaState
 from .config import AgentConfig, get_config_manager
 from .registry import agent, get_registry
 
+# Articles categorized per LLM call
+CATEGORIZE_BATCH_SIZE = 32
+
 
 def get_llm(config: Optional[AgentConfig] = None) -> ChatOpenAI:
     """Get LLM instance, optionally using agent config."""
@@ -116,6 +121,47 @@ async def deduplicate_articles(state: MayaState, config: AgentConfig = None) ->
     return {"raw_articles": unique_articles}
 
 
+async def _categorize_batch(llm: ChatOpenAI, batch: List[Dict[str, Any]]) -> List[str]:
+    """Categorize a batch of articles with a single LLM call."""
+    listing = "\n\n".join(
+        f"[{i}] Title: {article.get('title') or ''}\n"
+        f"Content: {(article.get('content') or '')[:500]}\n"
+        f"Source: {article.get('source_name', '')}"
+        for i, article in enumerate(batch)
+    )
+    prompt = BATCH_CATEGORIZATION_PROMPT.replace(
+        "${count}", str(len(batch))
+    ).replace(
+        "${articles}", listing
+    )
+
+    try:
+        response = await llm.ainvoke([HumanMessage(content=prompt)])
+        return _parse_categories(response.content, len(batch))
+    except Exception as e:
+        # Default to local if categorization fails
+        print(f"Categorization batch failed: {e}")
+        return ["local"] * len(batch)
+
+
+def _parse_categories(text: str, count: int) -> List[str]:
+    """Read the JSON array of categories from a batch response.
+
+    Tolerates surrounding prose or code fences. Entries that are missing
+    or unreadable default to local, as a failed categorization does.
+    """
+    start, end = text.find("["), text.rfind("]")
+    try:
+        categories = orjson.loads(text[start:end + 1]) if start != -1 else []
+    except orjson.JSONDecodeError:
+        categories = []
+    if not isinstance(categories, list):
+        categories = []
+
+    result = [str(category).strip().lower() for category in categories[:count]]
+    return result + ["local"] * (count - len(result))
+
+
 @agent("categorize")
 async def categorize_articles(state: MayaState, config: AgentConfig = None) -> Dict[str, Any]:
     """Categorize articles into local, business, and AI news.
@@ -141,28 +187,21 @@ async def categorize_articles(state: MayaState, config: AgentConfig = None) -> D
     business_news = []
     ai_news = []
 
-    for article in articles[:max_items]:
-        try:
-            prompt = CATEGORIZATION_PROMPT.replace(
-                "${title}", article.get("title") or ""
-            ).replace(
-                "${content}", (article.get("content") or "")[:500]
-            ).replace(
-                "${source}", article.get("source_name", "")
-            )
-
-            response = await llm.ainvoke([HumanMessage(content=prompt)])
-            category = response.content.strip().lower()
+    selected = articles[:max_items]
+    batches = [
+        selected[i:i + CATEGORIZE_BATCH_SIZE]
+        for i in range(0, len(selected), CATEGORIZE_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*(_categorize_batch(llm, batch) for batch in batches))
 
+    for batch, categories in zip(batches, results):
+        for article, category in zip(batch, categories):
             if category == "local":
                 local_news.append(article)
             elif category == "business":
                 business_news.append(article)
             elif category in ["ai_tech", "ai", "tech"]:
                 ai_news.append(article)
-        except Exception as e:
-            # Default to local if categorization fails
-            local_news.append(article)
 
     # Get per-segment limits
     local_limit = next((s.max_articles for s in segments if s.id == "local"), 15)
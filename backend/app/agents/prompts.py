@@ -145,6 +145,17 @@ Source: ${source}
 
 Respond with ONLY the category name (local, business, or ai_tech):"""
 
+BATCH_CATEGORIZATION_PROMPT = """Categorize each of the following ${count} news articles into one of these categories:
+- local: Malaysian/regional news, government policies, social issues, cultural events
+- business: Business news, SME-relevant economics, costs, employment, finance
+- ai_tech: AI news, technology, digital tools, e-commerce, social media platforms
+
+Articles:
+${articles}
+
+Respond with ONLY a JSON array of ${count} category names (local, business, or ai_tech),
+one per article in the order given, e.g. ["local", "ai_tech"]:"""
+
 RELEVANCE_PROMPT = """Rate the relevance of this news article for Malaysian SME owners on a scale of 0.0 to 1.0.
 
 TARGET AUDIENCE: Traditional Malaysian SME owners - kedai operators, F&B entrepreneurs,
@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Security
+from fastapi.responses import ORJSONResponse
 from fastapi.security import APIKeyHeader
-from typing import Optional, List
-from datetime import date
+from typing import Optional
+from datetime import date, datetime
 from uuid import UUID
 
 from app.models.schemas import (
@@ -97,22 +98,54 @@ async def create_briefing(
     }
 
 
-@router.get("/", response_model=List[WeeklyBriefing])
+@router.get("/", response_model=None)
 async def list_briefings(
     limit: int = 20,
-    offset: int = 0,
+    after: Optional[str] = Query(
+        default=None,
+        description="Cursor from the X-Next-Cursor header of the previous page",
+    ),
     status: Optional[PipelineStatus] = None,
 ):
-    """List all weekly briefings."""
+    """List all weekly briefings.
+
+    When a full page is returned, the ``X-Next-Cursor`` response header holds
+    the cursor to pass as ``after`` for the next page. The cursor is the
+    ``created_at`` and ``id`` of the last row joined by ``|``.
+    """
+    after_created, after_id = None, None
+    if after:
+        created, _, row_id = after.rpartition("|")
+        try:
+            if created:
+                after_created, after_id = datetime.fromisoformat(created), UUID(row_id)
+            else:
+                after_created = datetime.fromisoformat(row_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
     db = get_db_service()
-    return await db.list_briefings(limit=limit, offset=offset, status=status)
+    # Rows go straight to JSON; skip the Pydantic round trip for list views
+    rows = await db.list_briefing_rows(
+        limit=limit, after=after_created, after_id=after_id, status=status
+    )
+
+    response = ORJSONResponse(rows)
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        created_at = last["created_at"]
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        response.headers["X-Next-Cursor"] = f"{created_at}|{last['id']}"
 
+    return response
 
-@router.get("/pending", response_model=List[WeeklyBriefing])
+
+@router.get("/pending", response_model=None)
 async def list_pending_approvals():
     """List briefings awaiting approval."""
     db = get_db_service()
-    return await db.get_pending_approvals()
+    return ORJSONResponse(await db.get_pending_approval_rows())
 
 
 @router.get("/current", response_model=Optional[WeeklyBriefing])
@@ -180,7 +213,7 @@ async def get_briefing_video(thread_id: str):
     }
 
 
-@router.get("/{thread_id}/posts", response_model=dict)
+@router.get("/{thread_id}/posts", response_model=None)
 async def get_briefing_posts(thread_id: str):
     """Get social posts for a specific briefing."""
     db = get_db_service()
@@ -193,12 +226,12 @@ async def get_briefing_posts(thread_id: str):
     posts = []
 
     if video:
-        posts = await db.get_posts_by_video(video.id)
+        posts = await db.get_post_rows_by_video(video.id)
 
-    return {
+    return ORJSONResponse({
         "thread_id": thread_id,
         "posts": posts,
-    }
+    })
 
 
 @router.delete("/{thread_id}")
@@ -65,6 +65,7 @@ async def create_or_update_brand_profile(profile: BrandProfileCreate):
     else:
         response = supabase.table("brand_profile").insert(profile_data).execute()
 
+    _refresh_scoring_context()
     return response.data[0] if response.data else None
 
 
@@ -82,6 +83,13 @@ Prioritize content that aligns with these principles and serves our audience's n
 """
 
 
+def _refresh_scoring_context():
+    """Make guideline and brand profile edits visible to the next scoring call."""
+    from ..services.editorial_pipeline import get_editorial_pipeline
+
+    get_editorial_pipeline().refresh_scoring_context()
+
+
 # ===================
 # Editorial Guidelines
 # ===================
@@ -115,6 +123,7 @@ async def create_guideline(guideline: EditorialGuidelineCreate):
         "enabled": guideline.enabled,
     }
     response = supabase.table("editorial_guidelines").insert(data).execute()
+    _refresh_scoring_context()
     return response.data[0] if response.data else None
 
 
@@ -127,6 +136,7 @@ async def update_guideline(guideline_id: UUID, update: EditorialGuidelineUpdate)
 
     data["updated_at"] = datetime.utcnow().isoformat()
     response = supabase.table("editorial_guidelines").update(data).eq("id", str(guideline_id)).execute()
+    _refresh_scoring_context()
     return response.data[0] if response.data else None
 
 
@@ -134,6 +144,7 @@ async def update_guideline(guideline_id: UUID, update: EditorialGuidelineUpdate)
 async def delete_guideline(guideline_id: UUID):
     """Delete an editorial guideline."""
     supabase.table("editorial_guidelines").delete().eq("id", str(guideline_id)).execute()
+    _refresh_scoring_context()
     return {"deleted": True}
 
 
@@ -150,6 +161,7 @@ async def toggle_guideline(guideline_id: UUID):
         "updated_at": datetime.utcnow().isoformat()
     }).eq("id", str(guideline_id)).execute()
 
+    _refresh_scoring_context()
     return response.data[0] if response.data else None
 
 
@@ -251,6 +263,7 @@ async def import_default_guidelines():
         if response.data:
             inserted.append(response.data[0])
 
+    _refresh_scoring_context()
     return {"imported": len(inserted), "guidelines": inserted}
 
 
@@ -325,31 +338,9 @@ async def create_raw_story(story: RawStoryCreate, auto_score: bool = False, back
 
 async def _score_story_background(story_id: str):
     """Background task to score a single story."""
-    # Get story
-    story_response = supabase.table("raw_stories").select("*").eq("id", story_id).single().execute()
-    if not story_response.data:
-        return
-
-    story = story_response.data
-
-    # Get guidelines and brand profile
-    guidelines_response = supabase.table("editorial_guidelines").select("*").eq("enabled", True).execute()
-    guidelines = guidelines_response.data or []
-
-    profile_response = supabase.table("brand_profile").select("*").limit(1).execute()
-    brand_profile = profile_response.data[0] if profile_response.data else None
-
-    # Score the story
-    result = await editorial_agent.score_single_story(story, guidelines, brand_profile)
+    from ..services.editorial_pipeline import get_editorial_pipeline
 
-    # Update the story
-    supabase.table("raw_stories").update({
-        "status": "ranked",
-        "score": result.get("score"),
-        "rank": result.get("rank"),
-        "rank_reason": result.get("reason"),
-        "reviewed_at": datetime.utcnow().isoformat()
-    }).eq("id", story_id).execute()
+    await get_editorial_pipeline()._score_story(story_id)
 
 
 @router.get("/raw-stories/{story_id}")
@@ -381,8 +372,13 @@ async def score_raw_story(story_id: UUID):
     profile_response = supabase.table("brand_profile").select("*").limit(1).execute()
     brand_profile = profile_response.data[0] if profile_response.data else None
 
-    # Score the story
-    result = await editorial_agent.score_single_story(story, guidelines, brand_profile)
+    # Score the story, returning it to pending if scoring fails so the
+    # weekly review still picks it up
+    try:
+        result = await editorial_agent.score_single_story(story, guidelines, brand_profile)
+    except Exception as e:
+        supabase.table("raw_stories").update({"status": "pending"}).eq("id", str(story_id)).execute()
+        raise HTTPException(status_code=500, detail=f"Scoring failed: {str(e)}")
 
     # Update the story
     update_response = supabase.table("raw_stories").update({
@@ -715,6 +711,18 @@ async def aggregate_news(
     return result
 
 
+@router.post("/pipeline/score-batches/poll")
+async def poll_score_batches():
+    """
+    Apply results of finished OpenAI scoring batches submitted by auto-score
+    aggregation. Intended to be called periodically (e.g. from cron).
+    """
+    from ..services.editorial_pipeline import get_editorial_pipeline
+
+    pipeline = get_editorial_pipeline()
+    return await pipeline.poll_score_batches()
+
+
 @router.get("/pipeline/top-stories")
 async def get_top_stories(limit: int = Query(default=5, le=20)):
     """Get top-ranked stories ready for content creation."""
@@ -22,6 +22,8 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str = ""
     openai_model: str = "gpt-4o"
+    openai_caption_model: str = "gpt-4o-mini"  # Short social captions don't need the main model
+    openai_concurrency: int = 4  # Max in-flight OpenAI requests per batch job
 
     # HeyGen
     heygen_api_key: str = ""
@@ -1,5 +1,7 @@
 """Maya AI News Anchor - Main FastAPI Application."""
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -35,11 +37,24 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f"Warning: MCP initialization failed: {e}")
 
+    # Apply auto-scoring results as their OpenAI batches complete; both
+    # Supabase and OpenAI are needed, so skip it when either is unconfigured
+    score_poller = None
+    if settings.supabase_url and settings.supabase_key and settings.openai_api_key:
+        try:
+            from app.services.editorial_pipeline import get_editorial_pipeline
+            score_poller = asyncio.create_task(get_editorial_pipeline().run_score_batch_poller())
+        except Exception as e:
+            print(f"Warning: score batch poller not started: {e}")
+
     yield
 
     # Shutdown
     print("Shutting down Maya AI News Anchor")
 
+    if score_poller is not None:
+        score_poller.cancel()
+
     # Cleanup MCP resources
     if settings.mcp_enabled:
         try:
@@ -54,6 +69,14 @@ async def lifespan(app: FastAPI):
     aggregator = get_news_aggregator()
     await aggregator.close()
 
+    # Cleanup shared HTTP clients
+    from app.services.notification import get_notification_service
+    from app.services.ondemand import get_ondemand_service
+    from app.services.telegram_bot import get_telegram_bot
+    await get_notification_service().close()
+    await get_ondemand_service().close()
+    await get_telegram_bot().close()
+
 
 app = FastAPI(
     title="Maya AI News Anchor",
@@ -73,6 +96,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include API routes
@@ -129,4 +153,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
     )
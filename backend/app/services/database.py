@@ -1,11 +1,13 @@
 from supabase import create_client, Client
-from typing import Optional, List, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Any, AsyncIterator
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID, uuid4
-import json
+import asyncio
+
+import orjson
 
 from app.core.config import settings
 from app.models.schemas import (
@@ -40,6 +42,9 @@ SUPABASE_ENABLED = bool(settings.supabase_url and settings.supabase_key and
 if SUPABASE_ENABLED:
     from supabase import create_client, Client
 
+# Postgres NOTIFY channel fed by the notify_video_update() trigger
+VIDEO_UPDATES_CHANNEL = "video_updates"
+
 
 class DatabaseService:
     def __init__(self):
@@ -152,11 +157,17 @@ class DatabaseService:
 
         if self.mock_mode:
             if str(briefing_id) in self._briefings:
-                self._briefings[str(briefing_id)].update(update_data)
-                self._briefings[str(briefing_id)]["updated_at"] = datetime.utcnow()
-                return WeeklyBriefing(**self._briefings[str(briefing_id)])
+                current = self._briefings[str(briefing_id)]
+                # Skip no-op writes, mirroring the suppress_redundant trigger
+                if any(current.get(k) != v for k, v in update_data.items()):
+                    current.update(update_data)
+                    current["updated_at"] = datetime.utcnow()
+                return WeeklyBriefing(**current)
             raise ValueError(f"Briefing {briefing_id} not found")
 
+        if not update_data:
+            return await self.get_briefing(briefing_id)
+
         if "status" in update_data:
             update_data["status"] = update_data["status"].value
 
@@ -164,44 +175,98 @@ class DatabaseService:
             update_data
         ).eq("id", str(briefing_id)).execute()
 
+        if not result.data:
+            # The row was unchanged, so the database suppressed the write
+            return await self.get_briefing(briefing_id)
+
         return WeeklyBriefing(**result.data[0])
 
     async def list_briefings(
         self,
         limit: int = 20,
-        offset: int = 0,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
         status: Optional[PipelineStatus] = None,
     ) -> List[WeeklyBriefing]:
+        """List briefings newest first using keyset pagination.
+
+        Pass the ``created_at`` and ``id`` of the last briefing from the
+        previous page as ``after`` and ``after_id`` to fetch the next page.
+        The id breaks ties between briefings created at the same instant, so
+        none are skipped at a page boundary. Unlike offset pagination this
+        stays O(limit) on the ``(created_at, id) DESC`` index regardless of
+        page depth.
+        """
+        rows = await self.list_briefing_rows(
+            limit=limit, after=after, after_id=after_id, status=status
+        )
+        return [WeeklyBriefing(**item) for item in rows]
+
+    async def list_briefing_rows(
+        self,
+        limit: int = 20,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        status: Optional[PipelineStatus] = None,
+    ) -> List[dict]:
+        """Same as list_briefings, but returns raw rows without model hydration."""
         if self.mock_mode:
             briefings = list(self._briefings.values())
             if status:
                 briefings = [b for b in briefings if b["status"] == status]
-            briefings.sort(key=lambda x: x["created_at"], reverse=True)
-            return [WeeklyBriefing(**b) for b in briefings[offset:offset + limit]]
+            if after:
+                if after.tzinfo is not None:
+                    # Mock rows store naive UTC timestamps
+                    after = after.astimezone(timezone.utc).replace(tzinfo=None)
+                cursor = (after, str(after_id) if after_id else "")
+                briefings = [
+                    b for b in briefings
+                    if (b["created_at"], str(b["id"])) < cursor
+                ]
+            briefings.sort(key=lambda x: (x["created_at"], str(x["id"])), reverse=True)
+            return [dict(b) for b in briefings[:limit]]
 
         query = self.client.table("weekly_briefings").select("*")
 
         if status:
             query = query.eq("status", status.value)
+        if after:
+            # Values are quoted since timestamps contain PostgREST's reserved
+            # "." and ":" characters
+            created_at = after.isoformat()
+            if after_id:
+                query = query.or_(
+                    f'created_at.lt."{created_at}",'
+                    f'and(created_at.eq."{created_at}",id.lt.{after_id})'
+                )
+            else:
+                query = query.lt("created_at", created_at)
 
         result = query.order(
             "created_at", desc=True
-        ).range(offset, offset + limit - 1).execute()
+        ).order(
+            "id", desc=True
+        ).limit(limit).execute()
 
-        return [WeeklyBriefing(**item) for item in result.data]
+        return result.data
 
     async def get_pending_approvals(self) -> List[WeeklyBriefing]:
+        rows = await self.get_pending_approval_rows()
+        return [WeeklyBriefing(**item) for item in rows]
+
+    async def get_pending_approval_rows(self) -> List[dict]:
+        """Same as get_pending_approvals, but returns raw rows."""
         if self.mock_mode:
             pending_statuses = [
                 PipelineStatus.AWAITING_SCRIPT_APPROVAL,
                 PipelineStatus.AWAITING_VIDEO_APPROVAL,
             ]
             briefings = [
-                b for b in self._briefings.values()
+                dict(b) for b in self._briefings.values()
                 if b["status"] in pending_statuses
             ]
             briefings.sort(key=lambda x: x["created_at"], reverse=True)
-            return [WeeklyBriefing(**b) for b in briefings]
+            return briefings
 
         result = self.client.table("weekly_briefings").select("*").in_(
             "status", [
@@ -210,7 +275,7 @@ class DatabaseService:
             ]
         ).order("created_at", desc=True).execute()
 
-        return [WeeklyBriefing(**item) for item in result.data]
+        return result.data
 
     # Weekly Videos
     async def create_video(self, data: WeeklyVideoCreate) -> WeeklyVideo:
@@ -283,15 +348,24 @@ class DatabaseService:
 
         if self.mock_mode:
             if str(video_id) in self._videos:
-                self._videos[str(video_id)].update(update_data)
-                self._videos[str(video_id)]["updated_at"] = datetime.utcnow()
-                return WeeklyVideo(**self._videos[str(video_id)])
+                current = self._videos[str(video_id)]
+                if any(current.get(k) != v for k, v in update_data.items()):
+                    current.update(update_data)
+                    current["updated_at"] = datetime.utcnow()
+                return WeeklyVideo(**current)
             raise ValueError(f"Video {video_id} not found")
 
+        if not update_data:
+            return await self.get_video(video_id)
+
         result = self.client.table("weekly_videos").update(
             update_data
         ).eq("id", str(video_id)).execute()
 
+        if not result.data:
+            # The row was unchanged, so the database suppressed the write
+            return await self.get_video(video_id)
+
         return WeeklyVideo(**result.data[0])
 
     async def list_videos(self, limit: int = 20) -> List[WeeklyVideo]:
@@ -306,6 +380,35 @@ class DatabaseService:
 
         return [WeeklyVideo(**item) for item in result.data]
 
+    async def subscribe_video_updates(
+        self, video_id: Optional[UUID] = None
+    ) -> AsyncIterator[dict]:
+        """Yield weekly_videos rows as they change, via LISTEN/NOTIFY.
+
+        Use this instead of polling get_video: a single long-lived asyncpg
+        connection receives one notification per actual change. Pass
+        ``video_id`` to only receive updates for that video.
+        """
+        if not settings.database_url:
+            raise RuntimeError("DATABASE_URL is required for video update notifications")
+
+        import asyncpg
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_notify(connection, pid, channel, payload):
+            queue.put_nowait(payload)
+
+        conn = await asyncpg.connect(settings.database_url)
+        try:
+            await conn.add_listener(VIDEO_UPDATES_CHANNEL, on_notify)
+            while True:
+                row = orjson.loads(await queue.get())
+                if video_id is None or row["id"] == str(video_id):
+                    yield row
+        finally:
+            await conn.close()
+
     # Social Posts
     async def create_post(self, data: SocialPostCreate) -> SocialPost:
         if self.mock_mode:
@@ -363,15 +466,19 @@ class DatabaseService:
         return SocialPost(**result.data[0])
 
     async def get_posts_by_video(self, video_id: UUID) -> List[SocialPost]:
+        rows = await self.get_post_rows_by_video(video_id)
+        return [SocialPost(**item) for item in rows]
+
+    async def get_post_rows_by_video(self, video_id: UUID) -> List[dict]:
+        """Same as get_posts_by_video, but returns raw rows."""
         if self.mock_mode:
-            posts = [p for p in self._posts.values() if p["video_id"] == video_id]
-            return [SocialPost(**p) for p in posts]
+            return [dict(p) for p in self._posts.values() if p["video_id"] == video_id]
 
         result = self.client.table("social_posts").select("*").eq(
             "video_id", str(video_id)
         ).execute()
 
-        return [SocialPost(**item) for item in result.data]
+        return result.data
 
     # On-Demand Jobs
     async def create_ondemand_job(
@@ -639,9 +746,8 @@ class DatabaseService:
                 "total_posts": len(self._posts),
             }
 
-        briefings = self.client.table("weekly_briefings").select(
-            "id, status", count="exact"
-        ).execute()
+        # Aggregated server-side so only one row per status is transferred
+        status_counts = self.client.rpc("briefing_status_counts").execute()
 
         videos = self.client.table("weekly_videos").select(
             "id", count="exact"
@@ -651,18 +757,13 @@ class DatabaseService:
             "id", count="exact"
         ).execute()
 
-        total_briefings = briefings.count or 0
-        completed = len([
-            b for b in briefings.data
-            if b["status"] == PipelineStatus.COMPLETED.value
-        ])
-        pending = len([
-            b for b in briefings.data
-            if b["status"] in [
-                PipelineStatus.AWAITING_SCRIPT_APPROVAL.value,
-                PipelineStatus.AWAITING_VIDEO_APPROVAL.value,
-            ]
-        ])
+        counts = {row["status"]: row["count"] for row in status_counts.data or []}
+        total_briefings = sum(counts.values())
+        completed = counts.get(PipelineStatus.COMPLETED.value, 0)
+        pending = (
+            counts.get(PipelineStatus.AWAITING_SCRIPT_APPROVAL.value, 0)
+            + counts.get(PipelineStatus.AWAITING_VIDEO_APPROVAL.value, 0)
+        )
 
         return {
             "total_briefings": total_briefings,
@@ -1,15 +1,89 @@
 """Editorial Agent - LangGraph agent for story curation and ranking."""
 
-import json
+import asyncio
+import hashlib
+import itertools
+import logging
+import random
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, TypedDict
 from uuid import UUID, uuid4
 
+import orjson
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
 
 from ..core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Shared across all scoring calls so concurrent batches respect OpenAI rate limits
+_llm_semaphore = asyncio.Semaphore(settings.openai_concurrency)
+
+# Stories scored per LLM prompt; the guidelines prefix is sent once per batch
+STORIES_PER_PROMPT = 10
+
+# Attempts per scoring batch on API errors before falling back to default scores
+SCORE_ATTEMPTS = 3
+
+# Below this many top/high stories, titles are used as themes without an LLM call
+MIN_STORIES_FOR_THEMES = 3
+
+# Guideline weight indicators, indexed by integer weight (capped at 5)
+_WEIGHT_STARS = ["★" * n for n in range(6)]
+
+# OpenAI JSON mode; the top-level response must be an object, not an array
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Rendered guidelines prompts kept per agent, keyed by content hash
+GUIDELINES_PROMPT_CACHE_SIZE = 32
+
+
+# Static parts of the batch scoring prompt. Only the stories change between
+# batches, so the guidelines prefix is rendered once per guidelines context.
+SCORING_PROMPT_PREFIX = """You are an editorial AI assistant helping curate news stories for a media company.
+
+{guidelines}
+
+SCORING CRITERIA:
+- Score each story from 0-100 based on alignment with brand and guidelines
+- Assign a rank: top_priority (80-100), high (60-79), medium (40-59), low (20-39), rejected (0-19)
+- Provide a brief reason for the ranking
+
+STORIES TO REVIEW:
+"""
+
+SCORING_PROMPT_SUFFIX = """
+
+Respond with a JSON object holding a "results" array, one entry per story:
+{
+  "results": [
+    {
+      "story_id": "uuid-here",
+      "score": 85,
+      "rank": "top_priority",
+      "reason": "Highly relevant to AI technology pillar, timely, aligns with target audience interests",
+      "suggested_angle": "Focus on the business implications for SMEs",
+      "key_points": ["point 1", "point 2"]
+    }
+  ]
+}
+
+Only output the JSON object, no other text."""
+
+
+@lru_cache(maxsize=GUIDELINES_PROMPT_CACHE_SIZE)
+def _scoring_prompt_prefix(guidelines_context: str) -> str:
+    """Render the scoring prompt prefix for a guidelines context."""
+    return SCORING_PROMPT_PREFIX.format(guidelines=guidelines_context)
+
+
+def _truncate(text: str, limit: int = 2000) -> str:
+    """Trim story content for prompts, marking where it was cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class EditorialState(TypedDict):
     """State for the editorial review workflow."""
@@ -43,7 +117,10 @@ class EditorialAgent:
             temperature=0.3,
             api_key=settings.openai_api_key,
         )
+        # JSON mode guarantees parseable output for the structured prompts
+        self.json_llm = self.llm.bind(response_format=JSON_RESPONSE_FORMAT)
         self.workflow = self._build_workflow()
+        self._guidelines_prompt_cache: Dict[str, str] = {}
 
     def _build_workflow(self) -> StateGraph:
         """Build the LangGraph workflow for editorial review."""
@@ -55,19 +132,46 @@ class EditorialAgent:
         workflow.add_node("identify_themes", self._identify_themes)
         workflow.add_node("generate_summary", self._generate_summary)
         workflow.add_node("create_recommendations", self._create_recommendations)
+        workflow.add_node("write_editorial_notes", self._write_editorial_notes)
 
-        # Define edges
+        # Define edges. Nodes only wait on the state they read, so the
+        # recommendations list is built while the themes call is in flight,
+        # and the summary and notes calls run in parallel.
         workflow.set_entry_point("prepare_context")
         workflow.add_edge("prepare_context", "score_stories")
         workflow.add_edge("score_stories", "identify_themes")
+        workflow.add_edge("score_stories", "create_recommendations")
         workflow.add_edge("identify_themes", "generate_summary")
-        workflow.add_edge("generate_summary", "create_recommendations")
-        workflow.add_edge("create_recommendations", END)
+        workflow.add_edge(["identify_themes", "create_recommendations"], "write_editorial_notes")
+        workflow.add_edge("generate_summary", END)
+        workflow.add_edge("write_editorial_notes", END)
 
         return workflow.compile()
 
     def _build_guidelines_prompt(self, guidelines: List[Dict], brand_profile: Optional[Dict]) -> str:
-        """Build the guidelines context for the AI."""
+        """Build the guidelines context for the AI.
+
+        Rendered prompts are cached by a hash of their inputs, so repeated
+        calls return a byte-identical prefix that OpenAI can prefix-cache.
+        """
+        key = hashlib.blake2b(
+            orjson.dumps([guidelines, brand_profile], option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=16,
+        ).hexdigest()
+
+        cached = self._guidelines_prompt_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rendered = self._render_guidelines_prompt(guidelines, brand_profile)
+        if len(self._guidelines_prompt_cache) >= GUIDELINES_PROMPT_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._guidelines_prompt_cache.pop(next(iter(self._guidelines_prompt_cache)))
+        self._guidelines_prompt_cache[key] = rendered
+        return rendered
+
+    def _render_guidelines_prompt(self, guidelines: List[Dict], brand_profile: Optional[Dict]) -> str:
+        """Render the guidelines context from guidelines and brand profile."""
         prompt_parts = []
 
         if brand_profile:
@@ -85,19 +189,16 @@ BRAND PROFILE:
 """)
 
         # Group guidelines by category
-        guidelines_by_category = {}
+        guidelines_by_category: Dict[str, List[Dict]] = {}
         for g in guidelines:
             if g.get('enabled', True):
-                cat = g.get('category', 'other')
-                if cat not in guidelines_by_category:
-                    guidelines_by_category[cat] = []
-                guidelines_by_category[cat].append(g)
+                guidelines_by_category.setdefault(g.get('category', 'other'), []).append(g)
 
         prompt_parts.append("\nEDITORIAL GUIDELINES:")
         for category, items in guidelines_by_category.items():
             prompt_parts.append(f"\n{category.upper().replace('_', ' ')}:")
             for item in items:
-                weight_indicator = "★" * int(item.get('weight', 1))
+                weight_indicator = _WEIGHT_STARS[max(0, min(int(item.get('weight', 1)), 5))]
                 prompt_parts.append(f"  - {item['name']} [{weight_indicator}]: {item['criteria']}")
 
         return "\n".join(prompt_parts)
@@ -116,134 +217,175 @@ BRAND PROFILE:
             state.get("brand_profile")
         )
 
-        scored_stories = []
-
-        # Process stories in batches for efficiency
-        batch_size = 10
-        stories = state["raw_stories"]
+        state["scored_stories"] = await self._score_in_batches(
+            state["raw_stories"], guidelines_context
+        )
+        return state
 
-        for i in range(0, len(stories), batch_size):
-            batch = stories[i:i + batch_size]
+    async def _score_in_batches(
+        self,
+        stories: List[Dict[str, Any]],
+        guidelines_context: str,
+        fallback: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Score stories in prompt batches, dispatching all batches concurrently."""
+        batch_size = STORIES_PER_PROMPT
+        results = await asyncio.gather(*(
+            self._score_batch(stories[i:i + batch_size], i, guidelines_context, fallback)
+            for i in range(0, len(stories), batch_size)
+        ))
+        return list(itertools.chain.from_iterable(results))
+
+    def _batch_prompt(
+        self,
+        batch: List[Dict[str, Any]],
+        start: int,
+        guidelines_context: str,
+    ) -> str:
+        """Build the scoring prompt for a batch of stories."""
+        stories_text = "\n\n---\n\n".join(
+            f"STORY {j+1} (ID: {s['id']}):\nTitle: {s['title']}\nSource: {s['source_name']} ({s['source_type']})\nCategory: {s.get('category', 'N/A')}\n\nContent:\n{_truncate(s.get('content_markdown', ''))}"
+            for j, s in enumerate(batch, start=start)
+        )
 
-            stories_text = "\n\n---\n\n".join([
-                f"STORY {j+1} (ID: {s['id']}):\nTitle: {s['title']}\nSource: {s['source_name']} ({s['source_type']})\nCategory: {s.get('category', 'N/A')}\n\nContent:\n{s['content_markdown'][:2000]}..."
-                if len(s.get('content_markdown', '')) > 2000
-                else f"STORY {j+1} (ID: {s['id']}):\nTitle: {s['title']}\nSource: {s['source_name']} ({s['source_type']})\nCategory: {s.get('category', 'N/A')}\n\nContent:\n{s.get('content_markdown', '')}"
-                for j, s in enumerate(batch, start=i)
-            ])
+        return _scoring_prompt_prefix(guidelines_context) + stories_text + SCORING_PROMPT_SUFFIX
 
-            prompt = f"""You are an editorial AI assistant helping curate news stories for a media company.
+    def _parse_batch_scores(self, content: str) -> List[Dict[str, Any]]:
+        """Parse a JSON-mode batch score response.
 
-{guidelines_context}
-
-SCORING CRITERIA:
-- Score each story from 0-100 based on alignment with brand and guidelines
-- Assign a rank: top_priority (80-100), high (60-79), medium (40-59), low (20-39), rejected (0-19)
-- Provide a brief reason for the ranking
-
-STORIES TO REVIEW:
-{stories_text}
-
-Respond with a JSON array of objects, one per story:
-[
-  {{
-    "story_id": "uuid-here",
-    "score": 85,
-    "rank": "top_priority",
-    "reason": "Highly relevant to AI technology pillar, timely, aligns with target audience interests",
-    "suggested_angle": "Focus on the business implications for SMEs",
-    "key_points": ["point 1", "point 2"]
-  }}
-]
-
-Only output the JSON array, no other text."""
+        ``story_id`` is normalised to ``str`` here so downstream lookups can
+        use it as a dict key directly.
+        """
+        results = orjson.loads(content)["results"]
+        for result in results:
+            result["story_id"] = str(result.get("story_id"))
+        return results
 
+    async def _score_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        start: int,
+        guidelines_context: str,
+        fallback: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Score one batch of stories with a single LLM call.
+
+        API errors are retried with backoff; a batch that still fails, or
+        returns malformed output, gets default low scores so the other
+        batches' results are kept. With ``fallback=False`` the last API
+        error is raised instead, for callers that would rather leave the
+        story unscored.
+        """
+        prompt = self._batch_prompt(batch, start, guidelines_context)
+
+        for attempt in range(SCORE_ATTEMPTS):
             try:
-                response = await self.llm.ainvoke(prompt)
-                content = response.content.strip()
-
-                # Clean up response if needed
-                if content.startswith("```json"):
-                    content = content[7:]
-                if content.startswith("```"):
-                    content = content[3:]
-                if content.endswith("```"):
-                    content = content[:-3]
+                async with _llm_semaphore:
+                    response = await self.json_llm.ainvoke(prompt)
+                break
+            except Exception as e:
+                if attempt == SCORE_ATTEMPTS - 1:
+                    logger.warning(f"Scoring batch failed after {SCORE_ATTEMPTS} attempts: {e}")
+                    if not fallback:
+                        raise
+                    return self._default_scores(batch, e)
+                delay = 2 ** attempt
+                logger.debug(f"Scoring batch failed, retrying in {delay}s (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(delay + random.uniform(0, 0.25))
 
-                batch_scores = json.loads(content)
-                scored_stories.extend(batch_scores)
+        try:
+            return self._parse_batch_scores(response.content)
+        except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            return self._default_scores(batch, e)
+
+    def _default_scores(self, batch: List[Dict[str, Any]], error: Exception) -> List[Dict[str, Any]]:
+        """Low default scores for a batch that could not be scored."""
+        return [
+            {
+                "story_id": str(s["id"]),
+                "score": 25,
+                "rank": "low",
+                "reason": f"Error during scoring: {str(error)}",
+                "suggested_angle": None,
+                "key_points": []
+            }
+            for s in batch
+        ]
 
-            except Exception as e:
-                # On error, assign default low scores
-                for s in batch:
-                    scored_stories.append({
-                        "story_id": s["id"],
-                        "score": 25,
-                        "rank": "low",
-                        "reason": f"Error during scoring: {str(e)}",
-                        "suggested_angle": None,
-                        "key_points": []
-                    })
-
-        state["scored_stories"] = scored_stories
-        return state
+    async def _identify_themes(self, state: EditorialState) -> Dict[str, Any]:
+        """Identify key themes across the reviewed stories.
 
-    async def _identify_themes(self, state: EditorialState) -> EditorialState:
-        """Identify key themes across the reviewed stories."""
+        Runs in parallel with _create_recommendations, so it returns only the
+        keys it updates.
+        """
         # Get top stories for theme analysis
         top_stories = [s for s in state["scored_stories"] if s.get("rank") in ["top_priority", "high"]]
 
         if not top_stories:
-            state["key_themes"] = ["No significant themes identified this week"]
-            return state
+            return {"key_themes": ["No significant themes identified this week"]}
 
         # Get story details
+        raw_by_id = {str(r["id"]): r for r in state["raw_stories"]}
         story_details = []
+        missing = []
         for scored in top_stories[:20]:  # Limit to top 20
-            for raw in state["raw_stories"]:
-                if str(raw["id"]) == str(scored["story_id"]):
-                    story_details.append({
-                        "title": raw["title"],
-                        "category": raw.get("category"),
-                        "reason": scored.get("reason", "")
-                    })
-                    break
+            raw = raw_by_id.get(scored["story_id"])
+            if raw is None:
+                missing.append(scored["story_id"])
+                continue
+            story_details.append({
+                "title": raw["title"],
+                "category": raw.get("category"),
+                "reason": scored.get("reason", "")
+            })
+
+        if missing:
+            logger.warning(f"Scores referenced unknown story ids: {missing}")
+
+        # Too few stories to find themes across; use their titles directly
+        if len(story_details) < MIN_STORIES_FOR_THEMES:
+            return {"key_themes": [d["title"] for d in story_details] or [
+                "No significant themes identified this week"
+            ]}
 
         prompt = f"""Analyze these top-ranked news stories and identify 3-5 key themes for the week.
 
 Stories:
-{json.dumps(story_details, indent=2)}
+{orjson.dumps(story_details, option=orjson.OPT_INDENT_2).decode()}
 
-Respond with a JSON array of theme strings, e.g.:
-["AI adoption in Southeast Asian SMEs", "Regional tech policy changes", "Voice technology innovation"]
+Respond with a JSON object holding a "themes" array of strings, e.g.:
+{{"themes": ["AI adoption in Southeast Asian SMEs", "Regional tech policy changes", "Voice technology innovation"]}}
 
-Only output the JSON array."""
+Only output the JSON object."""
 
         try:
-            response = await self.llm.ainvoke(prompt)
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            state["key_themes"] = json.loads(content)
+            response = await self.json_llm.ainvoke(prompt)
+            key_themes = orjson.loads(response.content)["themes"]
         except Exception:
-            state["key_themes"] = ["Theme analysis unavailable"]
+            key_themes = ["Theme analysis unavailable"]
 
-        return state
+        return {"key_themes": key_themes}
+
+    async def _generate_summary(self, state: EditorialState) -> Dict[str, Any]:
+        """Generate executive summary of the editorial review.
 
-    async def _generate_summary(self, state: EditorialState) -> EditorialState:
-        """Generate executive summary of the editorial review."""
+        Runs in parallel with _write_editorial_notes, so it returns only the
+        keys it updates.
+        """
+        # Tally ranks and scores in a single pass
+        counts = Counter()
+        total_score = 0
+        for s in state["scored_stories"]:
+            counts[s.get("rank")] += 1
+            total_score += s.get("score", 0)
+
+        total = len(state["scored_stories"])
         stats = {
-            "total": len(state["scored_stories"]),
-            "top_priority": len([s for s in state["scored_stories"] if s.get("rank") == "top_priority"]),
-            "high": len([s for s in state["scored_stories"] if s.get("rank") == "high"]),
-            "medium": len([s for s in state["scored_stories"] if s.get("rank") == "medium"]),
-            "low": len([s for s in state["scored_stories"] if s.get("rank") == "low"]),
-            "rejected": len([s for s in state["scored_stories"] if s.get("rank") == "rejected"]),
+            "total": total,
+            **{rank: counts[rank] for rank in ("top_priority", "high", "medium", "low", "rejected")},
         }
 
-        avg_score = sum(s.get("score", 0) for s in state["scored_stories"]) / max(len(state["scored_stories"]), 1)
+        avg_score = total_score / max(total, 1)
 
         prompt = f"""Write a brief executive summary (2-3 paragraphs) for the editorial review of Week {state['week_number']}, {state['year']}.
 
@@ -267,14 +409,18 @@ Output only the summary text, no JSON."""
 
         try:
             response = await self.llm.ainvoke(prompt)
-            state["executive_summary"] = response.content.strip()
+            executive_summary = response.content.strip()
         except Exception as e:
-            state["executive_summary"] = f"Summary generation failed: {str(e)}"
+            executive_summary = f"Summary generation failed: {str(e)}"
 
-        return state
+        return {"executive_summary": executive_summary}
+
+    async def _create_recommendations(self, state: EditorialState) -> Dict[str, Any]:
+        """Create final recommendations list.
 
-    async def _create_recommendations(self, state: EditorialState) -> EditorialState:
-        """Create final recommendations list."""
+        Runs in parallel with _identify_themes, so it returns only the keys
+        it updates.
+        """
         recommendations = []
 
         # Sort by score descending
@@ -284,17 +430,16 @@ Output only the summary text, no JSON."""
             reverse=True
         )
 
+        raw_by_id = {str(r["id"]): r for r in state["raw_stories"]}
+
         for scored in sorted_stories:
             # Find the raw story
-            raw_story = None
-            for raw in state["raw_stories"]:
-                if str(raw["id"]) == str(scored["story_id"]):
-                    raw_story = raw
-                    break
+            story_id = scored["story_id"]
+            raw_story = raw_by_id.get(story_id)
 
             if raw_story:
                 recommendations.append({
-                    "raw_story_id": str(scored["story_id"]),
+                    "raw_story_id": story_id,
                     "title": raw_story["title"],
                     "rank": scored.get("rank", "low"),
                     "score": scored.get("score", 0),
@@ -303,9 +448,15 @@ Output only the summary text, no JSON."""
                     "key_points": scored.get("key_points", [])
                 })
 
-        state["recommendations"] = recommendations
+        return {"recommendations": recommendations}
+
+    async def _write_editorial_notes(self, state: EditorialState) -> Dict[str, Any]:
+        """Generate editorial notes from the recommendations and themes.
 
-        # Generate editorial notes
+        Runs in parallel with _generate_summary, so it returns only the keys
+        it updates.
+        """
+        recommendations = state["recommendations"]
         top_count = len([r for r in recommendations if r["rank"] == "top_priority"])
         prompt = f"""Based on this week's editorial review with {top_count} top priority stories, write brief editorial notes (2-3 sentences) with actionable advice for the content team.
 
@@ -315,11 +466,11 @@ Output only the notes text."""
 
         try:
             response = await self.llm.ainvoke(prompt)
-            state["editorial_notes"] = response.content.strip()
+            editorial_notes = response.content.strip()
         except Exception:
-            state["editorial_notes"] = "Focus on top priority stories for maximum impact."
+            editorial_notes = "Focus on top priority stories for maximum impact."
 
-        return state
+        return {"editorial_notes": editorial_notes}
 
     async def run_review(
         self,
@@ -336,6 +487,20 @@ Output only the notes text."""
         if year is None:
             year = now.year
 
+        # Nothing to review, so skip the workflow and its LLM calls
+        if not raw_stories:
+            return {
+                "success": True,
+                "week_number": week_number,
+                "year": year,
+                "total_reviewed": 0,
+                "executive_summary": "No stories were available for review this week.",
+                "key_themes": [],
+                "recommendations": [],
+                "editorial_notes": "",
+                "stats": {rank: 0 for rank in ("top_priority", "high", "medium", "low", "rejected")},
+            }
+
         initial_state: EditorialState = {
             "raw_stories": raw_stories,
             "guidelines": guidelines,
@@ -378,56 +543,70 @@ Output only the notes text."""
                 "year": year
             }
 
+    def build_score_request(
+        self,
+        stories: List[Dict[str, Any]],
+        guidelines_context: str,
+        custom_id: str,
+    ) -> Dict[str, Any]:
+        """Build one OpenAI Batch API request line scoring a batch of stories.
+
+        Results carry a ``story_id`` per story, so ``custom_id`` names the
+        request rather than a story and only has to be unique within the
+        batch file.
+        """
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.llm.model_name,
+                "temperature": self.llm.temperature,
+                "response_format": JSON_RESPONSE_FORMAT,
+                "messages": [
+                    {"role": "user", "content": self._batch_prompt(stories, 0, guidelines_context)}
+                ],
+            },
+        }
+
+    async def score_batch(
+        self,
+        stories: List[Dict[str, Any]],
+        guidelines: List[Dict[str, Any]],
+        brand_profile: Optional[Dict[str, Any]] = None,
+        fallback: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Score several stories, sharing the guidelines prompt across each batch.
+
+        Returns one result per story, each keyed by ``story_id``. With
+        ``fallback=False`` API failures raise instead of yielding default
+        scores.
+        """
+        guidelines_context = self._build_guidelines_prompt(guidelines, brand_profile)
+        return await self._score_in_batches(stories, guidelines_context, fallback)
+
     async def score_single_story(
         self,
         story: Dict[str, Any],
         guidelines: List[Dict[str, Any]],
         brand_profile: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Score a single story (for real-time ranking as stories come in)."""
-        guidelines_context = self._build_guidelines_prompt(guidelines, brand_profile)
-
-        prompt = f"""You are an editorial AI assistant. Score this news story based on the guidelines.
-
-{guidelines_context}
-
-STORY:
-Title: {story['title']}
-Source: {story.get('source_name', 'Unknown')} ({story.get('source_type', 'unknown')})
-Category: {story.get('category', 'N/A')}
-
-Content:
-{story.get('content_markdown', '')[:3000]}
-
-Score from 0-100 and assign rank: top_priority (80-100), high (60-79), medium (40-59), low (20-39), rejected (0-19)
-
-Respond with JSON:
-{{
-  "score": 75,
-  "rank": "high",
-  "reason": "Brief explanation",
-  "suggested_angle": "Optional angle suggestion",
-  "key_points": ["key point 1", "key point 2"]
-}}
-
-Only output the JSON."""
-
-        try:
-            response = await self.llm.ainvoke(prompt)
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            return json.loads(content)
-        except Exception as e:
-            return {
-                "score": 25,
-                "rank": "low",
-                "reason": f"Scoring error: {str(e)}",
-                "suggested_angle": None,
-                "key_points": []
-            }
+        """Score a single story (for real-time ranking as stories come in).
+
+        Raises if the LLM call keeps failing, so the caller can leave the
+        story unranked rather than store a default score.
+        """
+        results = await self.score_batch([story], guidelines, brand_profile, fallback=False)
+        for result in results:
+            if result["story_id"] == str(story["id"]):
+                return result
+        return results[0] if results else {
+            "score": 25,
+            "rank": "low",
+            "reason": "Scoring error: no result returned",
+            "suggested_angle": None,
+            "key_points": []
+        }
 
 
 # Singleton instance
@@ -1,14 +1,60 @@
 """Editorial Pipeline - Integrates news aggregation with editorial review system."""
 
+import asyncio
 import re
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+import orjson
+from openai import AsyncOpenAI
+
+from ..core.config import settings
 from ..core.database import supabase
 from ..models.schemas import NewsArticle
 from .news_aggregator import get_news_aggregator
-from .editorial_agent import editorial_agent
+from .editorial_agent import STORIES_PER_PROMPT, editorial_agent
+
+# OpenAI batch states that still need polling
+OPEN_BATCH_STATUSES = ["validating", "in_progress", "finalizing", "cancelling"]
+
+# Seconds between checks of open scoring batches by the background poller
+SCORE_BATCH_POLL_SECONDS = 300
+
+# How long guidelines and brand profile are reused between scoring calls
+SCORING_CONTEXT_TTL_SECONDS = 60
+
+# Max URLs per duplicate lookup. The URLs go in the GET query string, so
+# this keeps it well under common proxy URL limits (~8 KB)
+URL_LOOKUP_CHUNK_SIZE = 40
+
+# Max raw stories per bulk insert request
+INSERT_CHUNK_SIZE = 200
+
+# Category inference keywords, each list compiled into one case-insensitive
+# alternation so the text is scanned once per category
+AI_KEYWORDS = ["ai", "artificial intelligence", "machine learning", "chatgpt",
+               "openai", "llm", "neural", "automation", "robot", "tech"]
+BUSINESS_KEYWORDS = ["business", "market", "stock", "investment", "economy",
+                     "finance", "startup", "funding", "ipo", "revenue"]
+AI_KEYWORDS_PATTERN = re.compile("|".join(map(re.escape, AI_KEYWORDS)), re.IGNORECASE)
+BUSINESS_KEYWORDS_PATTERN = re.compile("|".join(map(re.escape, BUSINESS_KEYWORDS)), re.IGNORECASE)
+
+# Image and video URLs embedded in article content
+MEDIA_URL_PATTERN = re.compile(
+    r'https?://[^\s<>"]+?\.(?:jpg|jpeg|png|gif|webp|mp4|webm|mov)',
+    re.IGNORECASE,
+)
+
+
+def _request_story_ids(story_ids: List[str], custom_id: Optional[str]) -> List[str]:
+    """Story ids covered by a "score-<offset>" batch request line."""
+    try:
+        start = int((custom_id or "").removeprefix("score-"))
+    except ValueError:
+        return []
+    return story_ids[start:start + STORIES_PER_PROMPT]
 
 
 class EditorialPipelineService:
@@ -16,6 +62,43 @@ class EditorialPipelineService:
 
     def __init__(self):
         self.aggregator = get_news_aggregator()
+        self._openai: Optional[AsyncOpenAI] = None
+        self._context_fetched_at: Optional[float] = None
+        self._guidelines_cache: List[dict] = []
+        self._profile_cache: Optional[dict] = None
+
+    def _get_openai(self) -> AsyncOpenAI:
+        """Get or create the OpenAI client used for Batch API jobs."""
+        if self._openai is None:
+            self._openai = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._openai
+
+    def _get_scoring_context(self) -> Tuple[List[dict], Optional[dict]]:
+        """
+        Get enabled guidelines and the brand profile for scoring.
+
+        Cached for SCORING_CONTEXT_TTL_SECONDS since both change rarely;
+        call refresh_scoring_context() to force a reload.
+        """
+        now = time.monotonic()
+        if (
+            self._context_fetched_at is None
+            or now - self._context_fetched_at > SCORING_CONTEXT_TTL_SECONDS
+        ):
+            guidelines_response = supabase.table("editorial_guidelines").select("*").eq(
+                "enabled", True
+            ).execute()
+            profile_response = supabase.table("brand_profile").select("*").limit(1).execute()
+
+            self._guidelines_cache = guidelines_response.data or []
+            self._profile_cache = profile_response.data[0] if profile_response.data else None
+            self._context_fetched_at = now
+
+        return self._guidelines_cache, self._profile_cache
+
+    def refresh_scoring_context(self):
+        """Drop the cached guidelines and brand profile."""
+        self._context_fetched_at = None
 
     async def aggregate_and_store(
         self,
@@ -55,17 +138,36 @@ class EditorialPipelineService:
         stored_count = 0
         skipped_count = 0
         errors = []
+        to_score = []
+        rows_to_insert = []
+
+        # Look up already-stored URLs in bulk rather than once per article
+        urls = [a.url for a in articles if a.url]
+        existing_urls = set()
+        unchecked_urls = set()
+        for i in range(0, len(urls), URL_LOOKUP_CHUNK_SIZE):
+            chunk = urls[i:i + URL_LOOKUP_CHUNK_SIZE]
+            try:
+                existing = supabase.table("raw_stories").select("original_url").in_(
+                    "original_url", chunk
+                ).execute()
+                existing_urls.update(row["original_url"] for row in existing.data or [])
+            except Exception as e:
+                # original_url isn't unique in the table, so articles that
+                # couldn't be checked are left out rather than risk duplicates
+                unchecked_urls.update(chunk)
+                errors.append(f"Duplicate lookup of {len(chunk)} URLs failed: {str(e)}")
 
         for article in articles:
             try:
-                # Check for duplicates (by URL or title+source)
+                # Check for duplicates (by URL)
                 if article.url:
-                    existing = supabase.table("raw_stories").select("id").eq(
-                        "original_url", article.url
-                    ).execute()
-                    if existing.data:
+                    if article.url in unchecked_urls:
+                        continue
+                    if article.url in existing_urls:
                         skipped_count += 1
                         continue
+                    existing_urls.add(article.url)
 
                 # Convert to markdown format
                 content_markdown = self._to_markdown(article)
@@ -93,25 +195,215 @@ class EditorialPipelineService:
                     "status": "pending",
                 }
 
-                response = supabase.table("raw_stories").insert(raw_story_data).execute()
-                if response.data:
-                    stored_count += 1
-
-                    # Optionally auto-score
-                    if auto_score and response.data[0]:
-                        await self._score_story(response.data[0]["id"])
+                rows_to_insert.append(raw_story_data)
 
             except Exception as e:
                 errors.append(f"{article.source_name}: {str(e)}")
                 continue
 
+        # Insert new stories in chunks rather than one request per story
+        for i in range(0, len(rows_to_insert), INSERT_CHUNK_SIZE):
+            chunk = rows_to_insert[i:i + INSERT_CHUNK_SIZE]
+            try:
+                response = supabase.table("raw_stories").insert(chunk).execute()
+            except Exception as e:
+                errors.append(f"Insert of {len(chunk)} stories failed: {str(e)}")
+                continue
+
+            inserted = response.data or []
+            stored_count += len(inserted)
+
+            # Optionally auto-score
+            if auto_score:
+                to_score.extend(row["id"] for row in inserted)
+
+        # Auto-scoring isn't latency critical, so submit it as one Batch API job
+        score_batch_id = None
+        if to_score:
+            try:
+                score_batch_id = await self.submit_score_batch(to_score)
+            except Exception as e:
+                errors.append(f"Score batch submission failed: {str(e)}")
+
         return {
             "total_fetched": len(articles),
             "stored": stored_count,
             "skipped_duplicates": skipped_count,
+            "score_batch_id": score_batch_id,
             "errors": errors
         }
 
+    async def submit_score_batch(self, story_ids: List[str]) -> Optional[str]:
+        """
+        Submit an OpenAI Batch API job that scores the given raw stories.
+
+        Batch jobs are billed at half price and have separate rate limits.
+        Stories are marked as reviewing until poll_score_batches(), run
+        periodically by run_score_batch_poller(), applies the results.
+
+        Returns:
+            The OpenAI batch ID, or None if there was nothing to score
+        """
+        stories_response = supabase.table("raw_stories").select("*").in_(
+            "id", story_ids
+        ).execute()
+        stories = stories_response.data or []
+        if not stories:
+            return None
+
+        guidelines, brand_profile = self._get_scoring_context()
+        guidelines_context = editorial_agent._build_guidelines_prompt(guidelines, brand_profile)
+        jsonl = b"\n".join(
+            orjson.dumps(editorial_agent.build_score_request(
+                stories[i:i + STORIES_PER_PROMPT], guidelines_context, f"score-{i}"
+            ))
+            for i in range(0, len(stories), STORIES_PER_PROMPT)
+        )
+
+        client = self._get_openai()
+        input_file = await client.files.create(
+            file=("score_requests.jsonl", jsonl),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        submitted_ids = [str(story["id"]) for story in stories]
+        supabase.table("editorial_batches").insert({
+            "batch_id": batch.id,
+            "input_file_id": input_file.id,
+            "story_ids": submitted_ids,
+            "status": batch.status,
+        }).execute()
+        supabase.table("raw_stories").update({"status": "reviewing"}).in_(
+            "id", submitted_ids
+        ).execute()
+
+        return batch.id
+
+    async def poll_score_batches(self) -> dict:
+        """
+        Check open scoring batches and apply results of completed ones.
+
+        Stories that did not get a score (failed, expired or errored requests)
+        are returned to pending so the weekly review picks them up.
+        """
+        # The Supabase client is synchronous; run its calls in a thread so
+        # the background poller doesn't block the event loop
+        open_batches = await asyncio.to_thread(
+            supabase.table("editorial_batches").select("*").in_(
+                "status", OPEN_BATCH_STATUSES
+            ).execute
+        )
+
+        client = self._get_openai()
+        summary = {"checked": 0, "completed": 0, "scored": 0, "failed": 0}
+
+        for row in open_batches.data or []:
+            summary["checked"] += 1
+            try:
+                batch = await client.batches.retrieve(row["batch_id"])
+            except Exception as e:
+                print(f"Error retrieving score batch {row['batch_id']}: {e}")
+                continue
+
+            if batch.status in OPEN_BATCH_STATUSES:
+                if batch.status != row["status"]:
+                    await asyncio.to_thread(
+                        supabase.table("editorial_batches").update({
+                            "status": batch.status
+                        }).eq("id", row["id"]).execute
+                    )
+                continue
+
+            batch_story_ids = set(row["story_ids"])
+            scores = {}
+            if batch.status == "completed" and batch.output_file_id:
+                output = await client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    item = orjson.loads(line)
+                    response = item.get("response") or {}
+                    if response.get("status_code") != 200:
+                        continue
+                    try:
+                        content = response["body"]["choices"][0]["message"]["content"]
+                        results = editorial_agent._parse_batch_scores(content)
+                    except Exception as e:
+                        custom_id = item.get("custom_id")
+                        print(
+                            f"Error parsing scores for request {custom_id} "
+                            f"(stories {_request_story_ids(row['story_ids'], custom_id)}): {e}"
+                        )
+                        continue
+                    for result in results:
+                        story_id = result["story_id"]
+                        if story_id in batch_story_ids:
+                            scores[story_id] = result
+                await asyncio.to_thread(self._apply_scores, list(scores.values()))
+                summary["completed"] += 1
+            else:
+                summary["failed"] += 1
+
+            unscored = [sid for sid in row["story_ids"] if sid not in scores]
+            if unscored:
+                await asyncio.to_thread(
+                    supabase.table("raw_stories").update({"status": "pending"}).in_(
+                        "id", unscored
+                    ).execute
+                )
+
+            await asyncio.to_thread(
+                supabase.table("editorial_batches").update({
+                    "status": batch.status,
+                    "completed_at": datetime.utcnow().isoformat(),
+                }).eq("id", row["id"]).execute
+            )
+            summary["scored"] += len(scores)
+
+        return summary
+
+    async def run_score_batch_poller(self):
+        """
+        Poll open scoring batches every SCORE_BATCH_POLL_SECONDS until cancelled.
+
+        Started from the app lifespan, so auto-scored stories get their
+        scores (or go back to pending) without a manual poll request.
+        """
+        while True:
+            try:
+                summary = await self.poll_score_batches()
+                if summary["checked"]:
+                    print(f"Polled score batches: {summary}")
+            except Exception as e:
+                print(f"Error polling score batches: {e}")
+            await asyncio.sleep(SCORE_BATCH_POLL_SECONDS)
+
+    def _apply_scores(self, results: List[dict]):
+        """
+        Write scoring results back to raw stories in one RPC call.
+
+        Each result needs a story_id plus the score, rank and reason fields
+        returned by the editorial agent.
+        """
+        if not results:
+            return
+        supabase.rpc("apply_story_scores", {
+            "scores": [
+                {
+                    "id": str(result["story_id"]),
+                    "score": result.get("score"),
+                    "rank": result.get("rank"),
+                    "reason": result.get("reason"),
+                }
+                for result in results
+            ]
+        }).execute()
+
     async def _score_story(self, story_id: str):
         """Score a single raw story."""
         try:
@@ -125,25 +417,13 @@ class EditorialPipelineService:
             story = story_response.data
 
             # Get guidelines and brand profile
-            guidelines_response = supabase.table("editorial_guidelines").select("*").eq(
-                "enabled", True
-            ).execute()
-            guidelines = guidelines_response.data or []
-
-            profile_response = supabase.table("brand_profile").select("*").limit(1).execute()
-            brand_profile = profile_response.data[0] if profile_response.data else None
+            guidelines, brand_profile = self._get_scoring_context()
 
             # Score
             result = await editorial_agent.score_single_story(story, guidelines, brand_profile)
 
             # Update
-            supabase.table("raw_stories").update({
-                "status": "ranked",
-                "score": result.get("score"),
-                "rank": result.get("rank"),
-                "rank_reason": result.get("reason"),
-                "reviewed_at": datetime.utcnow().isoformat()
-            }).eq("id", story_id).execute()
+            self._apply_scores([{**result, "story_id": story_id}])
 
         except Exception as e:
             print(f"Error scoring story {story_id}: {e}")
@@ -199,34 +479,19 @@ class EditorialPipelineService:
 
     def _infer_category(self, text: str) -> str:
         """Infer category from text content."""
-        text_lower = text.lower()
-
-        # AI/Tech keywords
-        ai_keywords = ["ai", "artificial intelligence", "machine learning", "chatgpt",
-                       "openai", "llm", "neural", "automation", "robot", "tech"]
-        if any(kw in text_lower for kw in ai_keywords):
+        # AI/Tech keywords take priority over business ones
+        if AI_KEYWORDS_PATTERN.search(text):
             return "ai_tech"
 
-        # Business keywords
-        business_keywords = ["business", "market", "stock", "investment", "economy",
-                            "finance", "startup", "funding", "ipo", "revenue"]
-        if any(kw in text_lower for kw in business_keywords):
+        if BUSINESS_KEYWORDS_PATTERN.search(text):
             return "business"
 
         # Default to local
         return "local"
 
     def _extract_media_urls(self, content: str) -> List[str]:
-        """Extract media URLs from content."""
-        # Find image URLs
-        img_pattern = r'https?://[^\s<>"]+?\.(?:jpg|jpeg|png|gif|webp)'
-        images = re.findall(img_pattern, content, re.IGNORECASE)
-
-        # Find video URLs
-        video_pattern = r'https?://[^\s<>"]+?\.(?:mp4|webm|mov)'
-        videos = re.findall(video_pattern, content, re.IGNORECASE)
-
-        return list(set(images + videos))[:10]  # Limit to 10
+        """Extract image and video URLs from content."""
+        return list(dict.fromkeys(MEDIA_URL_PATTERN.findall(content)))[:10]  # Limit to 10
 
     async def run_weekly_review(self, week_number: Optional[int] = None, year: Optional[int] = None):
         """
@@ -295,17 +560,25 @@ class EditorialPipelineService:
                 "rejected_count": result["stats"]["rejected"],
                 "completed_at": datetime.utcnow().isoformat()
             }
-            supabase.table("editorial_reviews").insert(review_data).execute()
-
-            # Update stories with scores
-            for rec in result.get("recommendations", []):
-                supabase.table("raw_stories").update({
-                    "status": "ranked",
-                    "score": rec.get("score"),
-                    "rank": rec.get("rank"),
-                    "rank_reason": rec.get("reason"),
-                    "reviewed_at": datetime.utcnow().isoformat()
-                }).eq("id", rec["raw_story_id"]).execute()
+            try:
+                review_response = supabase.table("editorial_reviews").insert(review_data).execute()
+            except Exception as e:
+                # Stories stay pending, so the review can simply be rerun
+                return {**result, "success": False, "error": f"Could not store review: {str(e)}"}
+
+            # Rank stories only once the review is stored; if that fails,
+            # drop the review again so the week isn't blocked from a rerun
+            try:
+                self._apply_scores([
+                    {**rec, "story_id": rec["raw_story_id"]}
+                    for rec in result.get("recommendations", [])
+                ])
+            except Exception as e:
+                if review_response.data:
+                    supabase.table("editorial_reviews").delete().eq(
+                        "id", review_response.data[0]["id"]
+                    ).execute()
+                return {**result, "success": False, "error": f"Could not apply story scores: {str(e)}"}
 
         return result
 
@@ -1,11 +1,19 @@
 import asyncio
+import os
 import feedparser
 import aiohttp
 import ssl
 import certifi
-from datetime import datetime, timedelta
-from typing import List, Optional
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html import unescape as html_unescape
+from io import BytesIO
+from typing import Dict, List, NamedTuple, Optional
+from dateutil import parser as date_parser
+from lxml import etree, html as lxml_html
+import orjson
 import re
 
 from app.core.config import settings
@@ -50,23 +58,374 @@ TWITTER_ACCOUNTS = [
     "NikkeiAsia",
 ]
 
+# Timezone abbreviations seen in regional feeds, as UTC offsets in seconds,
+# so dateutil does not have to guess them
+TZINFOS = {
+    "EST": -5 * 3600, "EDT": -4 * 3600,
+    "CST": -6 * 3600, "CDT": -5 * 3600,
+    "PST": -8 * 3600, "PDT": -7 * 3600,
+    "SGT": 8 * 3600, "MYT": 8 * 3600, "HKT": 8 * 3600,
+    "WIB": 7 * 3600, "ICT": 7 * 3600, "JST": 9 * 3600,
+}
+
+USER_AGENT = "Mozilla/5.0 (compatible; MayaNewsBot/1.0)"
+
+# Runs of whitespace collapsed by clean_html
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Tag stripper for short markup and for markup lxml cannot parse
+TAG_PATTERN = re.compile(r"<[^>]+>")
+# Elements whose text is never part of the readable summary
+NON_TEXT_TAGS = ("script", "style", "noscript")
+NON_TEXT_PATTERN = re.compile(
+    r"<(script|style|noscript)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
+# Markup shorter than this is stripped with TAG_PATTERN instead of lxml
+SHORT_HTML_CHARS = 512
+
+# Feeds larger than this (advertised or actually sent) are skipped
+MAX_FEED_BYTES = 5 * 1024 * 1024
+
+# Chunk size used when reading feed bodies off the socket
+FEED_CHUNK_BYTES = 64 * 1024
+
+# Entry elements of RSS 2.0, RSS 1.0 (RDF) and Atom feeds
+FEED_ENTRY_TAGS = (
+    "item",
+    "{http://purl.org/rss/1.0/}item",
+    "{http://www.w3.org/2005/Atom}entry",
+)
+
+# Leading bytes inspected to tell feeds apart from HTML error pages
+SNIFF_BYTES = 512
+HTML_MARKERS = (b"<!doctype html", b"<html")
+
+# Per-instance limit when racing Nitter instances
+NITTER_TIMEOUT_SECONDS = 10
+
+# Feed fetches in flight at once (a Nitter race counts as one)
+FETCH_CONCURRENCY = 8
+
+# Worker processes for feed parsing; each one costs a Python interpreter
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Distinct date strings remembered by parse_date; items in a feed often
+# share a pubDate, and each parse worker keeps its own cache
+DATE_CACHE_SIZE = 4096
+
+
+class CachedFeed(NamedTuple):
+    """Validators and body from the last successful fetch of a feed."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+
+class ParsedFeed(NamedTuple):
+    """Articles parsed from a cached feed body, none older than cutoff."""
+    body: bytes
+    cutoff: datetime
+    articles: List[NewsArticle]
+
+
+def parse_date(date_str: Optional[str]) -> Optional[datetime]:
+    """Parse date string from various formats."""
+    if not date_str:
+        return None
+    return _parse_date_cached(date_str)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """parse_date for non-empty strings, memoised on the raw string."""
+    # RFC 822 (the RSS standard) via the stdlib parser, which is much
+    # faster than dateutil; fall back to dateutil for ISO 8601 and others
+    try:
+        dt = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        dt = None
+
+    # The stdlib returns a naive time for zone names it doesn't know
+    # (e.g. SGT), so those go through dateutil with TZINFOS as well
+    if dt is None or dt.tzinfo is None:
+        try:
+            dt = date_parser.parse(date_str, tzinfos=TZINFOS)
+        except Exception:
+            if dt is None:
+                return None
+
+    # Normalise to naive UTC, matching feedparser's parsed times
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.replace(tzinfo=None)
+
+
+def entry_published(entry) -> Optional[datetime]:
+    """Get a feed entry's publish time as naive UTC.
+
+    Uses feedparser's already-parsed ``published_parsed`` and only falls
+    back to parsing the raw string when it is missing.
+    """
+    published_parsed = entry.get("published_parsed")
+    if published_parsed:
+        return datetime(*published_parsed[:6])
+    return parse_date(entry.get("published"))
+
+
+def clean_html(html: str) -> str:
+    """Remove HTML tags and clean text."""
+    if not html:
+        return ""
+
+    if "<" not in html:
+        # Plain text (common for titles and Nitter summaries): no markup
+        # to strip, so skip both regex passes
+        text = html_unescape(html) if "&" in html else html
+    elif len(html) < SHORT_HTML_CHARS:
+        # Typical feed summaries are short enough that building an lxml
+        # tree costs more than the stripping; a regex pass is plenty
+        text = html_unescape(TAG_PATTERN.sub(" ", NON_TEXT_PATTERN.sub(" ", html)))
+    else:
+        try:
+            tree = lxml_html.document_fromstring(html)
+            etree.strip_elements(tree, *NON_TEXT_TAGS, with_tail=False)
+            text = " ".join(tree.itertext())
+        except (etree.ParserError, ValueError):
+            # Malformed or empty markup; strip tags textually instead
+            text = TAG_PATTERN.sub(" ", NON_TEXT_PATTERN.sub(" ", html))
+
+    # Clean up whitespace
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
+
+    return text
+
+
+class FeedEntry(NamedTuple):
+    """The fields read from a feed entry."""
+    title: str
+    link: str
+    summary: str
+    published: Optional[datetime]
+
+
+def _entry_fields(item) -> FeedEntry:
+    """Read an RSS <item> or Atom <entry> element."""
+    children = {}
+    link = ""
+    for child in item:
+        if not isinstance(child.tag, str):
+            continue  # Comments and processing instructions
+        name = etree.QName(child).localname
+        if name == "link" and not link:
+            # Atom links are <link rel="alternate" href="..."/>
+            if child.get("rel", "alternate") == "alternate":
+                link = child.get("href") or (child.text or "").strip()
+            continue
+        children.setdefault(name, child)
+
+    def text(*names: str) -> str:
+        for name in names:
+            child = children.get(name)
+            if child is not None:
+                value = "".join(child.itertext()).strip()
+                if value:
+                    return value
+        return ""
+
+    return FeedEntry(
+        title=text("title"),
+        link=link,
+        summary=text("description", "summary", "content"),
+        published=parse_date(text("pubDate", "published", "date", "updated")),
+    )
+
+
+def _iterparse_entries(content: bytes, limit: int) -> List[FeedEntry]:
+    """Read the first entries of a well-formed feed without building the whole tree."""
+    entries = []
+    context = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=FEED_ENTRY_TAGS,
+        resolve_entities=False,
+        no_network=True,
+    )
+    for _, item in context:
+        entries.append(_entry_fields(item))
+        if len(entries) >= limit:
+            break
+        # Free the items already read
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    return entries
+
+
+def _json_feed_entries(content: bytes, limit: int) -> List[FeedEntry]:
+    """First entries of a JSON Feed (jsonfeed.org) body."""
+    try:
+        items = orjson.loads(content).get("items") or []
+    except (orjson.JSONDecodeError, AttributeError):
+        return []
+    if not isinstance(items, list):
+        return []
+    return [
+        FeedEntry(
+            title=item.get("title") or "",
+            link=item.get("url") or "",
+            summary=item.get("summary") or item.get("content_html") or item.get("content_text") or "",
+            published=parse_date(item.get("date_published")),
+        )
+        for item in items[:limit]
+        if isinstance(item, dict)
+    ]
+
+
+def _sniff_feed(content: bytes) -> str:
+    """Guess a body's format from its first bytes: "xml", "json" or "html"."""
+    head = content[:SNIFF_BYTES].lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if head.startswith(b"{"):
+        return "json"
+    if any(marker in head for marker in HTML_MARKERS):
+        return "html"
+    return "xml"
+
+
+def feed_entries(content: bytes, limit: int) -> List[FeedEntry]:
+    """First entries of an RSS, Atom or JSON Feed body.
+
+    Well-formed XML feeds are read incrementally with lxml, stopping after
+    ``limit`` entries; anything lxml rejects goes through feedparser,
+    which is slower but far more forgiving. JSON feeds are read with
+    orjson, and HTML pages (error or captcha pages from flaky hosts) have
+    no entries and are skipped without parsing.
+    """
+    kind = _sniff_feed(content)
+    if kind == "html":
+        return []
+    if kind == "json":
+        return _json_feed_entries(content, limit)
+
+    try:
+        entries = _iterparse_entries(content, limit)
+    except etree.XMLSyntaxError:
+        entries = []
+    if entries:
+        return entries
+
+    # Raw bytes let feedparser detect the encoding itself
+    # without an extra decoded copy of the feed
+    feed = feedparser.parse(content)
+    return [
+        FeedEntry(
+            title=entry.get("title", ""),
+            link=entry.get("link", ""),
+            summary=entry.get("summary", "") or entry.get("description", ""),
+            published=entry_published(entry),
+        )
+        for entry in feed.entries[:limit]
+    ]
+
+
+def _is_recent(entry: FeedEntry, cutoff: Optional[datetime]) -> bool:
+    """Whether an entry is kept; undated entries count as published now."""
+    return cutoff is None or entry.published is None or entry.published >= cutoff
+
+
+def parse_rss_feed(
+    content: bytes,
+    source_name: str,
+    cutoff: Optional[datetime] = None
+) -> List[NewsArticle]:
+    """Parse an RSS feed body into articles published after cutoff.
+
+    Old entries are dropped before their summary is cleaned. Module-level
+    so it can run in a worker process.
+    """
+    return [
+        NewsArticle(
+            source_type="rss",
+            source_name=source_name,
+            title=entry.title,
+            content=clean_html(entry.summary),
+            url=entry.link,
+            published_at=entry.published or datetime.utcnow(),
+        )
+        for entry in feed_entries(content, 30)
+        if _is_recent(entry, cutoff)
+    ]
+
+
+def parse_nitter_feed(
+    content: bytes,
+    username: str,
+    cutoff: Optional[datetime] = None
+) -> List[NewsArticle]:
+    """Parse a Nitter RSS body into tweets published after cutoff.
+
+    Module-level so it can run in a worker process.
+    """
+    return [
+        NewsArticle(
+            source_type="nitter",
+            source_name=f"@{username}",
+            title=None,
+            content=clean_html(entry.title),
+            url=entry.link,
+            published_at=entry.published or datetime.utcnow(),
+        )
+        for entry in feed_entries(content, 20)
+        if _is_recent(entry, cutoff)
+    ]
+
 
 class NewsAggregatorService:
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
         # Create SSL context with certifi certificates
         self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+        # Last response per feed URL, for conditional GETs
+        self._feed_cache: Dict[str, CachedFeed] = {}
+        # Parsed articles per feed URL, reused while the body is unchanged
+        self._parsed_feeds: Dict[str, ParsedFeed] = {}
+        self._fetch_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        # Feed parsing is pure-Python CPU work, so it runs in worker processes
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
-            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+            # Long-lived session: keep connections and DNS results warm across
+            # aggregation runs so repeat fetches skip TCP/TLS setup
+            connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit=100,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                headers={"User-Agent": USER_AGENT},
+            )
         return self.session
 
     async def close(self):
         if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+
+    async def _run_cpu_bound(self, func, *args):
+        """Run a feed parser in the process pool, off the event loop."""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, func, *args)
 
     async def aggregate_all(self, days: int = 7) -> List[NewsArticle]:
         """Aggregate news from all sources."""
@@ -89,35 +448,49 @@ class NewsAggregatorService:
 
         return articles
 
-    async def _fetch_single_rss_feed(self, session: aiohttp.ClientSession, source_name: str, feed_url: str, cutoff: datetime) -> List[NewsArticle]:
-        articles = []
-        try:
-            async with session.get(feed_url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-
-                    for entry in feed.entries[:30]:
-                        published = self._parse_date(entry.get("published"))
-                        if published and published < cutoff:
-                            continue
-
-                        # Clean HTML from content
-                        content_raw = entry.get("summary", "") or entry.get("description", "")
-                        content_clean = self._clean_html(content_raw)
-
-                        articles.append(NewsArticle(
-                            source_type="rss",
-                            source_name=source_name,
-                            title=entry.get("title", ""),
-                            content=content_clean,
-                            url=entry.get("link", ""),
-                            published_at=published or datetime.utcnow(),
-                        ))
-        except Exception as e:
-            print(f"Error fetching RSS {source_name}: {e}")
-
-        return articles
+    async def _fetch_feed(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """Fetch a feed body, revalidating against the previous fetch.
+
+        Sends the last ETag / Last-Modified and reuses the cached body on a
+        304. Returns None for other non-200 responses and for feeds over
+        MAX_FEED_BYTES.
+        """
+        cached = self._feed_cache.get(url)
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached.body
+            if response.status != 200:
+                return None
+
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_FEED_BYTES:
+                print(f"Skipping oversized feed {url}: {content_length} bytes")
+                return None
+
+            # Read in chunks so a feed without Content-Length is dropped as
+            # soon as it passes the cap rather than buffered in full
+            chunks = []
+            size = 0
+            async for chunk in response.content.iter_chunked(FEED_CHUNK_BYTES):
+                size += len(chunk)
+                if size > MAX_FEED_BYTES:
+                    print(f"Skipping oversized feed {url}: over {MAX_FEED_BYTES} bytes")
+                    return None
+                chunks.append(chunk)
+            body = b"".join(chunks)
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._feed_cache[url] = CachedFeed(etag, last_modified, body)
+            return body
 
     async def fetch_rss_feeds(self, days: int = 7) -> List[NewsArticle]:
         """Fetch articles from RSS feeds."""
@@ -150,33 +523,39 @@ class NewsAggregatorService:
         """Fetch and parse a single RSS feed."""
         articles = []
         try:
-            async with session.get(feed_url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-
-                    for entry in feed.entries[:30]:
-                        published = self._parse_date(entry.get("published"))
-                        if published and published < cutoff:
-                            continue
-
-                        # Clean HTML from content
-                        content_raw = entry.get("summary", "") or entry.get("description", "")
-                        content_clean = self._clean_html(content_raw)
-
-                        articles.append(NewsArticle(
-                            source_type="rss",
-                            source_name=source_name,
-                            title=entry.get("title", ""),
-                            content=content_clean,
-                            url=entry.get("link", ""),
-                            published_at=published or datetime.utcnow(),
-                        ))
+            async with self._fetch_semaphore:
+                content = await self._fetch_feed(session, feed_url)
+            if content is not None:
+                articles = await self._parse_feed(feed_url, content, cutoff, parse_rss_feed, source_name)
         except Exception as e:
             print(f"Error fetching RSS {source_name}: {e}")
 
         return articles
 
+    async def _parse_feed(
+        self,
+        url: str,
+        content: bytes,
+        cutoff: datetime,
+        parser,
+        *args
+    ) -> List[NewsArticle]:
+        """Parse a feed body and keep the articles published after cutoff.
+
+        _fetch_feed hands back the very same cached body object on a 304,
+        so an identity check is enough to skip re-parsing an unchanged feed.
+        The parser drops old entries itself, so a cached parse is only
+        reused for a cutoff no earlier than the one it was made with.
+        """
+        parsed = self._parsed_feeds.get(url)
+        if parsed is None or parsed.body is not content or cutoff < parsed.cutoff:
+            articles = await self._run_cpu_bound(parser, content, *args, cutoff)
+            parsed = ParsedFeed(content, cutoff, articles)
+            if url in self._feed_cache:
+                self._parsed_feeds[url] = parsed
+
+        return [article for article in parsed.articles if article.published_at >= cutoff]
+
     async def fetch_nitter_feeds(self, days: int = 7) -> List[NewsArticle]:
         """Fetch tweets via Nitter RSS (free Twitter alternative)."""
         cutoff = datetime.utcnow() - timedelta(days=days)
@@ -204,37 +583,47 @@ class NewsAggregatorService:
         username: str,
         cutoff: datetime
     ) -> List[NewsArticle]:
-        """Fetch tweets for a single user with fallback."""
-        articles = []
-        for nitter_instance in NITTER_INSTANCES:
+        """Fetch tweets for a single user from whichever Nitter instance answers first.
+
+        All instances are raced; the first usable feed wins and the
+        remaining requests are cancelled.
+        """
+        async with self._fetch_semaphore:
+            tasks = [
+                asyncio.create_task(self._try_nitter(session, instance, username, cutoff))
+                for instance in NITTER_INSTANCES
+            ]
+            pending = set(tasks)
             try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        articles = task.result()
+                        if articles is not None:
+                            return articles
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        return []
+
+    async def _try_nitter(
+        self,
+        session: aiohttp.ClientSession,
+        nitter_instance: str,
+        username: str,
+        cutoff: datetime
+    ) -> Optional[List[NewsArticle]]:
+        """Fetch a user's feed from one Nitter instance, or None if it fails."""
+        try:
+            async with asyncio.timeout(NITTER_TIMEOUT_SECONDS):
                 url = f"{nitter_instance}/{username}/rss"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-
-                        for entry in feed.entries[:20]:
-                            published = self._parse_date(entry.get("published"))
-                            if published and published < cutoff:
-                                continue
-
-                            content_clean = self._clean_html(entry.get("title", ""))
-
-                            articles.append(NewsArticle(
-                                source_type="nitter",
-                                source_name=f"@{username}",
-                                title=None,
-                                content=content_clean,
-                                url=entry.get("link", ""),
-                                published_at=published or datetime.utcnow(),
-                            ))
-                        return articles  # Success, return immediately
-            except Exception:
-                continue  # Try next Nitter instance
-
-        # Flatten list of lists
-        return [article for sublist in results for article in sublist]
+                content = await self._fetch_feed(session, url)
+                if content is None:
+                    return None
+                return await self._parse_feed(url, content, cutoff, parse_nitter_feed, username)
+        except Exception:
+            return None
 
     async def fetch_telegram_channels(self, days: int = 7) -> List[NewsArticle]:
         """Fetch messages from Telegram channels."""
@@ -278,31 +667,14 @@ class NewsAggregatorService:
 
         return articles
 
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse date string from various formats."""
-        if not date_str:
-            return None
+    def _entry_published(self, entry) -> Optional[datetime]:
+        return entry_published(entry)
 
-        from dateutil import parser
-        try:
-            dt = parser.parse(date_str)
-            # Remove timezone info for consistency
-            return dt.replace(tzinfo=None)
-        except Exception:
-            return None
+    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
+        return parse_date(date_str)
 
     def _clean_html(self, html: str) -> str:
-        """Remove HTML tags and clean text."""
-        if not html:
-            return ""
-
-        soup = BeautifulSoup(html, "lxml")
-        text = soup.get_text(separator=" ")
-
-        # Clean up whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        return clean_html(html)
 
 
 # Singleton instance
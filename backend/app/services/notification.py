@@ -1,10 +1,20 @@
 import httpx
 from typing import Optional, Dict, Any
-import json
+import orjson
 
 from app.core.config import settings
 
 
+# Payloads are serialized with orjson and posted as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Static part of the Slack "View Details" button; only the URL varies
+VIEW_DETAILS_BUTTON = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "View Details"},
+}
+
+
 class NotificationService:
     """Service for sending notifications via Slack or Telegram."""
 
@@ -12,6 +22,28 @@ class NotificationService:
         self.slack_webhook = settings.slack_webhook_url
         self.telegram_token = settings.telegram_bot_token
         self.telegram_chat_id = settings.telegram_chat_id
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, reusing pooled connections across sends."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _post_json(self, url: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST a JSON payload, serialized with orjson."""
+        return await self._get_client().post(
+            url,
+            content=orjson.dumps(payload),
+            headers=JSON_HEADERS,
+        )
 
     async def send_script_approval_request(
         self,
@@ -142,8 +174,7 @@ Review and approve at: {settings.frontend_url}/briefings/{thread_id}
                         "value": thread_id,
                     },
                     {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "View Details"},
+                        **VIEW_DETAILS_BUTTON,
                         "url": f"{settings.frontend_url}/briefings/{thread_id}",
                     }
                 ]
@@ -151,12 +182,8 @@ Review and approve at: {settings.frontend_url}/briefings/{thread_id}
         ]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.slack_webhook,
-                    json={"blocks": blocks},
-                )
-                return response.status_code == 200
+            response = await self._post_json(self.slack_webhook, {"blocks": blocks})
+            return response.status_code == 200
         except Exception as e:
             print(f"Slack notification error: {e}")
             return False
@@ -164,12 +191,8 @@ Review and approve at: {settings.frontend_url}/briefings/{thread_id}
     async def _send_slack_simple(self, message: str) -> bool:
         """Send simple Slack message without buttons."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.slack_webhook,
-                    json={"text": message},
-                )
-                return response.status_code == 200
+            response = await self._post_json(self.slack_webhook, {"text": message})
+            return response.status_code == 200
         except Exception as e:
             print(f"Slack notification error: {e}")
             return False
@@ -179,16 +202,12 @@ Review and approve at: {settings.frontend_url}/briefings/{thread_id}
         try:
             url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json={
-                        "chat_id": self.telegram_chat_id,
-                        "text": message,
-                        "parse_mode": "Markdown",
-                    },
-                )
-                return response.status_code == 200
+            response = await self._post_json(url, {
+                "chat_id": self.telegram_chat_id,
+                "text": message,
+                "parse_mode": "Markdown",
+            })
+            return response.status_code == 200
         except Exception as e:
             print(f"Telegram notification error: {e}")
             return False
@@ -1,9 +1,10 @@
 """Service for on-demand article-to-video generation."""
 
+import asyncio
 import httpx
 from typing import List, Optional
 from uuid import UUID
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 
@@ -80,6 +81,76 @@ Ringkasan: {summary}
 Kapsyen (Bahasa Melayu):
 """
 
+# Output caps: a 150-225 word script (Malay runs ~1.5x the tokens of
+# English) and a ~200 character caption plus hashtags
+SCRIPT_MAX_TOKENS = 600
+CAPTION_MAX_TOKENS = 300
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath equivalent of the CSS class selector ``.class_name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# Common article content containers, in priority order
+CONTENT_CLASSES = ("article-content", "post-content", "entry-content", "story-body")
+
+# All content container candidates, found in a single pass over the tree
+CONTENT_XPATH = etree.XPath(
+    "//article | //*[@itemprop='articleBody'] | "
+    + " | ".join(f"//*[{_class_xpath(name)}]" for name in CONTENT_CLASSES)
+    + " | //main"
+)
+
+
+def _content_priority(element) -> int:
+    """Rank a content container candidate; lower is tried first."""
+    if element.tag == "article":
+        return 0
+    if element.get("itemprop") == "articleBody":
+        return 1
+    classes = (element.get("class") or "").split()
+    for rank, name in enumerate(CONTENT_CLASSES, start=2):
+        if name in classes:
+            return rank
+    return len(CONTENT_CLASSES) + 2  # <main>
+
+
+def _content_candidates(tree) -> list:
+    """First matching container per selector, in priority order."""
+    best = {}
+    for element in CONTENT_XPATH(tree):
+        best.setdefault(_content_priority(element), element)
+    return [best[rank] for rank in sorted(best)]
+
+
+# Paragraphs of a container, skipping any inside page chrome or ads. Only
+# ancestors deeper than the container ($depth) count, so a container that
+# itself sits inside, say, a <header> is still read. The tree is never
+# mutated, so candidates can be tried one after another.
+PARAGRAPHS_XPATH = etree.XPath(
+    ".//p[not(ancestor-or-self::*["
+    "(self::script or self::style or self::nav or self::header or self::footer"
+    f" or {_class_xpath('ad')} or {_class_xpath('advertisement')})"
+    " and count(ancestor::*) > $depth])]"
+)
+
+
+def _paragraphs(element) -> list:
+    """Content paragraphs of an element, without page chrome or ads."""
+    depth = sum(1 for _ in element.iterancestors())
+    return PARAGRAPHS_XPATH(element, depth=depth)
+
+
+def _stripped_text(element) -> str:
+    """Join an element's text nodes, each stripped (like bs4 get_text(strip=True))."""
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _join_paragraphs(paragraphs) -> str:
+    """Join the non-empty paragraph texts with blank lines."""
+    return "\n\n".join(text for text in map(_stripped_text, paragraphs) if text)
+
 
 class OnDemandService:
     """Service for processing on-demand article-to-video requests."""
@@ -89,7 +160,31 @@ class OnDemandService:
             model=settings.openai_model,
             api_key=settings.openai_api_key,
             temperature=0.7,
+            max_tokens=SCRIPT_MAX_TOKENS,
+        )
+        self.caption_llm = ChatOpenAI(
+            model=settings.openai_caption_model,
+            api_key=settings.openai_api_key,
+            temperature=0.7,
+            max_tokens=CAPTION_MAX_TOKENS,
         )
+        self._scrape_client: Optional[httpx.AsyncClient] = None
+
+    def _get_scrape_client(self) -> httpx.AsyncClient:
+        """Get the shared client used to fetch article pages."""
+        if self._scrape_client is None or self._scrape_client.is_closed:
+            self._scrape_client = httpx.AsyncClient(
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                },
+                follow_redirects=True,
+                timeout=30.0,
+            )
+        return self._scrape_client
+
+    async def close(self):
+        if self._scrape_client and not self._scrape_client.is_closed:
+            await self._scrape_client.aclose()
 
     async def process_article(
         self,
@@ -110,14 +205,7 @@ class OnDemandService:
 
             # Step 2: Generate scripts in requested languages
             await db.update_ondemand_status(job_id, "generating_script")
-            scripts = {}
-            captions = {}
-
-            for lang in languages:
-                script = await self._generate_script(content, lang)
-                caption = await self._generate_caption(title, script[:200], lang)
-                scripts[lang.value] = script
-                captions[lang.value] = caption
+            scripts, captions = await self._generate_scripts_and_captions(content, title, languages)
 
             await db.update_ondemand_scripts(job_id, scripts, captions)
 
@@ -131,57 +219,34 @@ class OnDemandService:
 
     async def _scrape_article(self, url: str) -> tuple[str, str]:
         """Scrape article content from URL."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-                follow_redirects=True,
-                timeout=30.0,
-            )
-            response.raise_for_status()
+        response = await self._get_scrape_client().get(url)
+        response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        try:
+            tree = lxml_html.document_fromstring(
+                response.content,
+                parser=lxml_html.HTMLParser(encoding=response.encoding),
+            )
+        except etree.ParserError:
+            return "", ""
 
         # Try to extract title
-        title = ""
-        if soup.title:
-            title = soup.title.string or ""
+        title = tree.findtext(".//title") or ""
         if not title:
-            h1 = soup.find("h1")
-            if h1:
-                title = h1.get_text(strip=True)
+            h1 = tree.find(".//h1")
+            if h1 is not None:
+                title = _stripped_text(h1)
 
         # Try to extract main content
-        # Common article content selectors
-        content_selectors = [
-            "article",
-            "[itemprop='articleBody']",
-            ".article-content",
-            ".post-content",
-            ".entry-content",
-            ".story-body",
-            "main",
-        ]
-
         content = ""
-        for selector in content_selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Remove unwanted elements
-                for unwanted in element.select("script, style, nav, header, footer, .ad, .advertisement"):
-                    unwanted.decompose()
-
-                paragraphs = element.find_all("p")
-                content = "\n\n".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-                if len(content) > 200:
-                    break
+        for element in _content_candidates(tree):
+            content = _join_paragraphs(_paragraphs(element))
+            if len(content) > 200:
+                break
 
         if not content:
             # Fallback to all paragraphs
-            paragraphs = soup.find_all("p")
-            content = "\n\n".join(p.get_text(strip=True) for p in paragraphs[:20] if p.get_text(strip=True))
+            content = _join_paragraphs(_paragraphs(tree)[:20])
 
         # Limit content length
         if len(content) > 5000:
@@ -189,6 +254,30 @@ class OnDemandService:
 
         return content, title
 
+    async def _generate_scripts_and_captions(
+        self,
+        content: str,
+        title: str,
+        languages: List[Language],
+    ) -> tuple[dict, dict]:
+        """Generate script and caption for each language, languages in parallel.
+
+        Each caption still waits for its own script, since it summarises it.
+        """
+        async def generate(lang: Language) -> tuple[str, str]:
+            script = await self._generate_script(content, lang)
+            caption = await self._generate_caption(title, script[:200], lang)
+            return script, caption
+
+        results = await asyncio.gather(*(generate(lang) for lang in languages))
+
+        scripts = {}
+        captions = {}
+        for lang, (script, caption) in zip(languages, results):
+            scripts[lang.value] = script
+            captions[lang.value] = caption
+        return scripts, captions
+
     async def _generate_script(self, content: str, language: Language) -> str:
         """Generate Maya script from article content."""
         if language == Language.ENGLISH:
@@ -206,7 +295,7 @@ class OnDemandService:
         else:
             prompt = CAPTION_PROMPT_MS.format(title=title, summary=summary)
 
-        response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+        response = await self.caption_llm.ainvoke([HumanMessage(content=prompt)])
         return response.content
 
     async def _send_telegram_approval(
@@ -236,19 +325,17 @@ class OnDemandService:
         try:
             await db.update_ondemand_status(job_id, "generating_video")
 
-            video_urls = {}
-
-            # Generate video for each language
-            if job.script_en:
-                result = await heygen.generate_video(job.script_en)
+            async def render(script: str) -> str:
+                result = await heygen.generate_video(script)
                 status = await heygen.wait_for_video(result["video_id"])
-                video_urls["en"] = status["video_url"]
+                return status["video_url"]
 
-            if job.script_ms:
-                # Note: You might need a different voice_id for Malay
-                result = await heygen.generate_video(job.script_ms)
-                status = await heygen.wait_for_video(result["video_id"])
-                video_urls["ms"] = status["video_url"]
+            # Generate video for each language, rendering in parallel
+            # Note: You might need a different voice_id for Malay
+            scripts = {"en": job.script_en, "ms": job.script_ms}
+            languages = [lang for lang, script in scripts.items() if script]
+            urls = await asyncio.gather(*(render(scripts[lang]) for lang in languages))
+            video_urls = dict(zip(languages, urls))
 
             await db.update_ondemand_videos(job_id, video_urls)
 
@@ -278,27 +365,26 @@ class OnDemandService:
         try:
             await db.update_ondemand_status(job_id, "publishing")
 
-            results = []
-
-            # Publish English version
-            if job.video_url_en and job.caption_en:
-                result = await blotato.schedule_multi_platform(
-                    video_url=job.video_url_en,
-                    caption=job.caption_en,
+            # Publish English and Malay versions in parallel
+            versions = [
+                ("en", job.video_url_en, job.caption_en, ["MayaNews", "SEANews", "BreakingNews"]),
+                ("ms", job.video_url_ms, job.caption_ms, ["MayaNews", "BeritaMalaysia", "BeritaTerkini"]),
+            ]
+            versions = [v for v in versions if v[1] and v[2]]
+
+            scheduled = await asyncio.gather(*(
+                blotato.schedule_multi_platform(
+                    video_url=video_url,
+                    caption=caption,
                     platforms=job.platforms,
-                    hashtags=["MayaNews", "SEANews", "BreakingNews"],
+                    hashtags=hashtags,
                 )
-                results.append({"language": "en", "posts": result["posts"]})
-
-            # Publish Malay version
-            if job.video_url_ms and job.caption_ms:
-                result = await blotato.schedule_multi_platform(
-                    video_url=job.video_url_ms,
-                    caption=job.caption_ms,
-                    platforms=job.platforms,
-                    hashtags=["MayaNews", "BeritaMalaysia", "BeritaTerkini"],
-                )
-                results.append({"language": "ms", "posts": result["posts"]})
+                for _, video_url, caption, hashtags in versions
+            ))
+            results = [
+                {"language": lang, "posts": result["posts"]}
+                for (lang, *_), result in zip(versions, scheduled)
+            ]
 
             await db.update_ondemand_status(job_id, "completed")
             await db.update_ondemand_published(job_id)
@@ -322,15 +408,11 @@ class OnDemandService:
         if not job:
             raise ValueError("Job not found")
 
-        scripts = {}
-        captions = {}
-
-        for lang_str in job.languages:
-            lang = Language(lang_str)
-            script = await self._generate_script(job.original_content, lang)
-            caption = await self._generate_caption(job.title, script[:200], lang)
-            scripts[lang.value] = script
-            captions[lang.value] = caption
+        scripts, captions = await self._generate_scripts_and_captions(
+            job.original_content,
+            job.title,
+            [Language(lang_str) for lang_str in job.languages],
+        )
 
         await db.update_ondemand_scripts(job_id, scripts, captions)
         await db.update_ondemand_status(job_id, "awaiting_approval")
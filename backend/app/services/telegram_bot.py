@@ -1,11 +1,259 @@
 """Telegram bot service for approval notifications."""
 
+import asyncio
+import html
+import logging
+import random
+import re
 import httpx
-from typing import Optional, Dict
-from urllib.parse import urlencode
+import orjson
+from typing import Awaitable, Dict, List, Optional, Set
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Bot API send limits: ~30 messages/s overall and 1 message/s per chat
+TELEGRAM_GLOBAL_RATE = 30
+TELEGRAM_CHAT_RATE = 1
+
+# Notifications queued within this window are sent as one message
+NOTIFICATION_COALESCE_SECONDS = 0.5
+
+# Send queued notifications straight away once they reach this size
+NOTIFICATION_FLUSH_CHARS = 3000
+
+# Bot API limit on message text
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# Payloads are serialized with orjson and posted as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Bot API limit on media captions; longer captions continue in a reply
+TELEGRAM_CAPTION_LIMIT = 1024
+CAPTION_CONTINUED = "\n… (continued)"
+
+# Attempts per Bot API call when rate limited (429) or on server errors
+SEND_ATTEMPTS = 4
+
+
+class TokenBucket:
+    """Paces callers to ``rate`` acquisitions per second, allowing bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class TelegramRateLimiter:
+    """Keeps sends under Telegram's global and per-chat limits instead of hitting 429s."""
+
+    def __init__(self):
+        self._global = TokenBucket(TELEGRAM_GLOBAL_RATE, TELEGRAM_GLOBAL_RATE)
+        self._chats: Dict[str, TokenBucket] = {}
+
+    async def acquire(self, chat_id: str) -> None:
+        chat_bucket = self._chats.get(chat_id)
+        if chat_bucket is None:
+            chat_bucket = self._chats[chat_id] = TokenBucket(TELEGRAM_CHAT_RATE, 1)
+        await chat_bucket.acquire()
+        await self._global.acquire()
+
+
+# Control characters Telegram rejects in message text
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Units of Telegram HTML that must not be cut: tags, entities, single chars
+HTML_TOKEN_PATTERN = re.compile(r"<[^>]*>|&#?\w+;|.", re.DOTALL)
+HTML_TAG_PATTERN = re.compile(r"<(/?)(\w+)")
+
+# Inline button callback data: "<action>:<job id>:<job type>". The job id
+# match is greedy so ids containing ":" still parse.
+CALLBACK_DATA_PATTERN = re.compile(r"^(?P<action>\w+):(?P<job_id>.+):(?P<job_type>\w+)$")
+
+# Static message fragments, filled per message and joined with blank lines
+SCRIPT_APPROVAL_HEADER = (
+    "<b>📝 Script Approval Required</b>\n\n"
+    "<b>Type:</b> {job_type}\n"
+    "<b>Title:</b> {title}"
+)
+SCRIPT_APPROVAL_FOOTER = (
+    "<b>Job ID:</b> <code>{job_id}</code>\n\n"
+    "Review the full scripts and approve to generate video."
+)
+
+VIDEO_APPROVAL_HEADER = (
+    "<b>🎬 Video Approval Required</b>\n\n"
+    "<b>Type:</b> {job_type}\n"
+    "<b>Job ID:</b> <code>{job_id}</code>\n\n"
+    "Videos have been generated and are ready for review."
+)
+VIDEO_APPROVAL_FOOTER = "Approve to publish to social media platforms."
+
+WEEKLY_APPROVAL_HEADER = (
+    "<b>📰 Weekly Briefing - Week {week_number}, {year}</b>\n\n"
+    "Scripts are ready for your review!"
+)
+WEEKLY_APPROVAL_FOOTER = "<b>Thread ID:</b> <code>{thread_id}</code>"
+
+PLATFORM_EMOJIS = {
+    "instagram": "📸",
+    "facebook": "📘",
+    "tiktok": "🎵",
+    "youtube": "▶️",
+}
+DEFAULT_PLATFORM_EMOJI = "📱"
+
+LANGUAGE_NAMES = {
+    "en": "English",
+    "ms": "Bahasa Melayu",
+}
+
+# Weekly briefing segments, as (scripts key, heading)
+WEEKLY_SECTIONS = (
+    ("local", "Local News"),
+    ("business", "Business"),
+    ("ai", "AI & Tech"),
+)
+
+PUBLISHED_TEMPLATE = (
+    "<b>✅ Published Successfully!</b>\n\n"
+    "<b>Job ID:</b> <code>{job_id}</code>\n\n"
+    "Published to:\n{platforms}\n\n"
+    "View analytics in the dashboard."
+)
+
+ERROR_TEMPLATE = (
+    "<b>❌ Error Occurred</b>\n\n"
+    "<b>Job ID:</b> <code>{job_id}</code>\n"
+    "<b>Error:</b> {error}\n\n"
+    "Please check the dashboard for details."
+)
+
+
+def _split_html(text: str, limit: int) -> tuple:
+    """Split HTML text into a head of at most ``limit`` characters and the rest.
+
+    Cuts at the last whitespace within the limit when there is one, never
+    inside a tag or entity. Tags open at the cut are closed at the end of
+    the head and reopened at the start of the rest, so both parts parse.
+    """
+    if len(text) <= limit:
+        return text, ""
+
+    open_tags: List[tuple] = []
+    closing_length = 0
+    cut = word_cut = None
+    for match in HTML_TOKEN_PATTERN.finditer(text):
+        position, token = match.start(), match.group()
+        if position + closing_length > limit:
+            break
+        if position > 0:
+            cut = (position, list(open_tags))
+            if token.isspace():
+                word_cut = cut
+
+        tag = HTML_TAG_PATTERN.match(token)
+        if tag and tag.group(1):
+            if open_tags and open_tags[-1][0] == tag.group(2):
+                open_tags.pop()
+                closing_length -= len(tag.group(2)) + 3
+        elif tag:
+            open_tags.append((tag.group(2), token))
+            closing_length += len(tag.group(2)) + 3
+
+    position, tags = word_cut or cut or (limit, [])
+    head = text[:position].rstrip() + "".join(f"</{name}>" for name, _ in reversed(tags))
+    rest = "".join(opening for _, opening in tags) + text[position:].lstrip()
+    return head, rest
+
+
+def _escape(text: str) -> str:
+    """Make text safe for Telegram's HTML parse mode."""
+    return CONTROL_CHARS_PATTERN.sub("", html.escape(text, quote=False))
+
+
+def _preview(text: str, limit: int) -> str:
+    """First ``limit`` characters of text, escaped, with an ellipsis if it was cut."""
+    return _escape(text) if len(text) <= limit else f"{_escape(text[:limit])}..."
+
+
+def _language_name(lang: str) -> str:
+    return LANGUAGE_NAMES.get(lang, "Bahasa Melayu")
+
+
+def _job_type_label(job_type: str) -> str:
+    return job_type.replace("_", " ").title()
+
+
+# Inline keyboards as rows of (label, button field, value template); the
+# templates are filled with the job id, job type and frontend URL per message
+SCRIPT_APPROVAL_KEYBOARD = (
+    (
+        ("✅ Approve", "callback_data", "approve_script:{id}:{type}"),
+        ("❌ Reject", "callback_data", "reject_script:{id}:{type}"),
+    ),
+    (
+        ("📝 View Full Scripts", "url", "{frontend}/on-demand/{id}"),
+    ),
+)
+
+VIDEO_APPROVAL_KEYBOARD = (
+    (
+        ("✅ Approve & Publish", "callback_data", "approve_video:{id}:{type}"),
+        ("❌ Reject", "callback_data", "reject_video:{id}:{type}"),
+    ),
+    (
+        ("🔄 Regenerate Video", "callback_data", "regenerate_video:{id}:{type}"),
+    ),
+)
+
+WEEKLY_APPROVAL_KEYBOARD = (
+    (
+        ("✅ Approve Scripts", "callback_data", "approve_script:{id}:{type}"),
+        ("❌ Reject", "callback_data", "reject_script:{id}:{type}"),
+    ),
+    (
+        ("📝 View & Edit in Dashboard", "url", "{frontend}/briefings/{id}"),
+    ),
+)
+
+
+def _render_keyboard(template: tuple, job_id: str, job_type: str, frontend_url: str) -> list:
+    """Build inline keyboard buttons from a keyboard template."""
+    return [
+        [
+            {"text": label, field: value.format(id=job_id, type=job_type, frontend=frontend_url)}
+            for label, field, value in row
+        ]
+        for row in template
+    ]
+
+
+def _response_json(response: httpx.Response) -> dict:
+    """Bot API response body; gateway errors may not be JSON."""
+    try:
+        return response.json()
+    except ValueError:
+        return {"ok": False, "error_code": response.status_code, "description": response.text[:200]}
+
 
 class TelegramBot:
     """Telegram bot for sending approval requests and notifications."""
@@ -15,12 +263,80 @@ class TelegramBot:
         self.chat_id = settings.telegram_chat_id
         self.base_url = f"https://api.telegram.org/bot{self.token}"
         self.callback_base = settings.backend_url
+        self.frontend_url = settings.frontend_url
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter = TelegramRateLimiter()
+        # Notifications waiting to be coalesced into one message
+        self._pending_notifications: List[str] = []
+        self._pending_chars = 0
+        self._notification_flush: Optional[asyncio.Task] = None
+        # Flush tasks still running, referenced so they aren't garbage collected
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared Bot API client, reusing pooled connections across sends."""
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent sends over one connection, so a
+            # slow sendVideo doesn't hold up quick messages behind it
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._client
+
+    async def close(self):
+        # Send notifications still waiting out the coalescing window
+        if self._notification_flush:
+            self._notification_flush.cancel()
+            self._notification_flush = None
+        # Let flushes already sending finish before closing the client
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self._flush_notifications()
+
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _post(self, method: str, payload: dict, **kwargs) -> dict:
+        """Call a Bot API method, retrying rate limits and server errors.
+
+        A 429 waits out the ``retry_after`` Telegram sends back; a 5xx backs
+        off exponentially. Both add a little jitter.
+        """
+        body = orjson.dumps(payload)
+        for attempt in range(SEND_ATTEMPTS):
+            await self._limiter.acquire(self.chat_id)
+            response = await self._get_client().post(
+                f"/{method}",
+                content=body,
+                headers=JSON_HEADERS,
+                **kwargs,
+            )
+
+            if response.status_code == 429:
+                delay = _response_json(response).get("parameters", {}).get("retry_after", 1)
+            elif response.status_code >= 500:
+                delay = 2 ** attempt
+            else:
+                break
+
+            if attempt == SEND_ATTEMPTS - 1:
+                break
+            logger.debug(
+                "Telegram %s returned %s, retrying in %ss (attempt %d)",
+                method, response.status_code, delay, attempt + 1,
+            )
+            await asyncio.sleep(delay + random.uniform(0, 0.25))
+
+        return _response_json(response)
 
     async def _send_message(
         self,
         text: str,
         reply_markup: Optional[dict] = None,
         parse_mode: str = "HTML",
+        reply_to_message_id: Optional[int] = None,
     ) -> dict:
         """Send a message to the configured chat."""
         if not self.token or not self.chat_id:
@@ -35,14 +351,10 @@ class TelegramBot:
 
         if reply_markup:
             payload["reply_markup"] = reply_markup
+        if reply_to_message_id:
+            payload["reply_to_message_id"] = reply_to_message_id
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/sendMessage",
-                json=payload,
-                timeout=30.0,
-            )
-            return response.json()
+        return await self._post("sendMessage", payload)
 
     async def _send_video(
         self,
@@ -50,27 +362,95 @@ class TelegramBot:
         caption: str,
         reply_markup: Optional[dict] = None,
     ) -> dict:
-        """Send a video message."""
+        """Send a video message.
+
+        Captions over Telegram's caption limit are cut at a word boundary
+        and the rest follows as replies to the video, instead of being lost.
+        Markup open at a cut is closed and reopened so each part still parses.
+        """
         if not self.token or not self.chat_id:
             return {"ok": False, "error": "Not configured"}
 
+        remainder = ""
+        if len(caption) > TELEGRAM_CAPTION_LIMIT:
+            caption, remainder = _split_html(caption, TELEGRAM_CAPTION_LIMIT - len(CAPTION_CONTINUED))
+            caption += CAPTION_CONTINUED
+
         payload = {
             "chat_id": self.chat_id,
             "video": video_url,
-            "caption": caption[:1024],  # Telegram caption limit
+            "caption": caption,
             "parse_mode": "HTML",
         }
 
         if reply_markup:
             payload["reply_markup"] = reply_markup
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/sendVideo",
-                json=payload,
-                timeout=60.0,
-            )
-            return response.json()
+        result = await self._post("sendVideo", payload, timeout=60.0)
+
+        message_id = (result.get("result") or {}).get("message_id")
+        while remainder and result.get("ok"):
+            chunk, remainder = _split_html(remainder, TELEGRAM_MESSAGE_LIMIT)
+            await self._send_message(text=chunk, reply_to_message_id=message_id)
+
+        return result
+
+    async def send_many(self, sends: List[Awaitable]) -> list:
+        """Run several sends concurrently, e.g. approvals for a batch of jobs.
+
+        The rate limiter still paces the requests; overlapping them saves
+        waiting on each round trip in turn. Failures are returned in place
+        rather than raised.
+        """
+        return await asyncio.gather(*sends, return_exceptions=True)
+
+    async def _enqueue(self, text: str) -> None:
+        """Queue a notification; queued ones are sent together shortly after."""
+        if not self.token or not self.chat_id:
+            print("Telegram bot not configured")
+            return
+
+        text = text.strip()
+        self._pending_notifications.append(text)
+        self._pending_chars += len(text)
+
+        if self._pending_chars >= NOTIFICATION_FLUSH_CHARS:
+            if self._notification_flush:
+                self._notification_flush.cancel()
+                self._notification_flush = None
+            await self._flush_notifications()
+        elif self._notification_flush is None:
+            task = asyncio.create_task(self._flush_notifications_later())
+            self._notification_flush = task
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_notifications_later(self) -> None:
+        """Flush after the coalescing window, logging failures.
+
+        Runs as a background task, so an exception raised here would
+        otherwise only surface as "Task exception was never retrieved".
+        """
+        await asyncio.sleep(NOTIFICATION_COALESCE_SECONDS)
+        self._notification_flush = None
+        try:
+            await self._flush_notifications()
+        except Exception:
+            logger.exception("Failed to send queued Telegram notifications")
+
+    async def _flush_notifications(self) -> None:
+        """Send queued notifications, packed into as few messages as fit."""
+        pending, self._pending_notifications = self._pending_notifications, []
+        self._pending_chars = 0
+
+        message = ""
+        for text in pending:
+            if message and len(message) + 2 + len(text) > TELEGRAM_MESSAGE_LIMIT:
+                await self._send_message(text=message)
+                message = ""
+            message = f"{message}\n\n{text}" if message else text
+        if message:
+            await self._send_message(text=message)
 
     def _create_inline_keyboard(self, buttons: list) -> dict:
         """Create inline keyboard markup."""
@@ -86,45 +466,17 @@ class TelegramBot:
         scripts: Dict[str, str],
     ):
         """Send script approval request with inline buttons."""
-        # Format message
-        message = f"""
-<b>📝 Script Approval Required</b>
-
-<b>Type:</b> {job_type.replace('_', ' ').title()}
-<b>Title:</b> {title[:100]}
-
-"""
+        parts = [SCRIPT_APPROVAL_HEADER.format(job_type=_job_type_label(job_type), title=_escape(title[:100]))]
         # Add script previews
-        for lang, script in scripts.items():
-            lang_name = "English" if lang == "en" else "Bahasa Melayu"
-            preview = script[:300] + "..." if len(script) > 300 else script
-            message += f"<b>{lang_name}:</b>\n<pre>{preview}</pre>\n\n"
-
-        message += f"""
-<b>Job ID:</b> <code>{job_id}</code>
-
-Review the full scripts and approve to generate video.
-"""
+        parts.extend(
+            f"<b>{_language_name(lang)}:</b>\n<pre>{_preview(script, 300)}</pre>"
+            for lang, script in scripts.items()
+        )
+        parts.append(SCRIPT_APPROVAL_FOOTER.format(job_id=job_id))
+        message = "\n\n".join(parts)
 
         # Create approval buttons
-        buttons = [
-            [
-                {
-                    "text": "✅ Approve",
-                    "callback_data": f"approve_script:{job_id}:{job_type}"
-                },
-                {
-                    "text": "❌ Reject",
-                    "callback_data": f"reject_script:{job_id}:{job_type}"
-                },
-            ],
-            [
-                {
-                    "text": "📝 View Full Scripts",
-                    "url": f"{settings.frontend_url}/on-demand/{job_id}"
-                },
-            ],
-        ]
+        buttons = _render_keyboard(SCRIPT_APPROVAL_KEYBOARD, job_id, job_type, self.frontend_url)
 
         await self._send_message(
             text=message,
@@ -138,40 +490,18 @@ Review the full scripts and approve to generate video.
         video_urls: Dict[str, str],
     ):
         """Send video approval request."""
-        message = f"""
-<b>🎬 Video Approval Required</b>
-
-<b>Type:</b> {job_type.replace('_', ' ').title()}
-<b>Job ID:</b> <code>{job_id}</code>
-
-Videos have been generated and are ready for review.
-
-"""
         # List video URLs
-        for lang, url in video_urls.items():
-            lang_name = "English" if lang == "en" else "Bahasa Melayu"
-            message += f"<b>{lang_name}:</b> <a href='{url}'>View Video</a>\n"
-
-        message += "\nApprove to publish to social media platforms."
-
-        buttons = [
-            [
-                {
-                    "text": "✅ Approve & Publish",
-                    "callback_data": f"approve_video:{job_id}:{job_type}"
-                },
-                {
-                    "text": "❌ Reject",
-                    "callback_data": f"reject_video:{job_id}:{job_type}"
-                },
-            ],
-            [
-                {
-                    "text": "🔄 Regenerate Video",
-                    "callback_data": f"regenerate_video:{job_id}:{job_type}"
-                },
-            ],
-        ]
+        video_links = "\n".join(
+            f"<b>{_language_name(lang)}:</b> <a href='{url}'>View Video</a>"
+            for lang, url in video_urls.items()
+        )
+        message = "\n\n".join((
+            VIDEO_APPROVAL_HEADER.format(job_type=_job_type_label(job_type), job_id=job_id),
+            video_links,
+            VIDEO_APPROVAL_FOOTER,
+        ))
+
+        buttons = _render_keyboard(VIDEO_APPROVAL_KEYBOARD, job_id, job_type, self.frontend_url)
 
         await self._send_message(
             text=message,
@@ -184,30 +514,13 @@ Videos have been generated and are ready for review.
         platforms: list,
     ):
         """Send notification when video is published."""
-        platform_emojis = {
-            "instagram": "📸",
-            "facebook": "📘",
-            "tiktok": "🎵",
-            "youtube": "▶️",
-        }
-
         platform_text = "\n".join([
-            f"{platform_emojis.get(p, '📱')} {p.title()}"
+            f"{PLATFORM_EMOJIS.get(p, DEFAULT_PLATFORM_EMOJI)} {p.title()}"
             for p in platforms
         ])
 
-        message = f"""
-<b>✅ Published Successfully!</b>
-
-<b>Job ID:</b> <code>{job_id}</code>
-
-Published to:
-{platform_text}
-
-View analytics in the dashboard.
-"""
-
-        await self._send_message(text=message)
+        message = PUBLISHED_TEMPLATE.format(job_id=job_id, platforms=platform_text)
+        await self._enqueue(message)
 
     async def send_weekly_briefing_approval(
         self,
@@ -217,41 +530,15 @@ View analytics in the dashboard.
         scripts: Dict[str, str],
     ):
         """Send weekly briefing script approval."""
-        message = f"""
-<b>📰 Weekly Briefing - Week {week_number}, {year}</b>
-
-Scripts are ready for your review!
-
-<b>Local News:</b>
-<pre>{scripts.get('local', 'N/A')[:200]}...</pre>
-
-<b>Business:</b>
-<pre>{scripts.get('business', 'N/A')[:200]}...</pre>
-
-<b>AI & Tech:</b>
-<pre>{scripts.get('ai', 'N/A')[:200]}...</pre>
-
-<b>Thread ID:</b> <code>{thread_id}</code>
-"""
-
-        buttons = [
-            [
-                {
-                    "text": "✅ Approve Scripts",
-                    "callback_data": f"approve_script:{thread_id}:weekly"
-                },
-                {
-                    "text": "❌ Reject",
-                    "callback_data": f"reject_script:{thread_id}:weekly"
-                },
-            ],
-            [
-                {
-                    "text": "📝 View & Edit in Dashboard",
-                    "url": f"{settings.frontend_url}/briefings/{thread_id}"
-                },
-            ],
-        ]
+        parts = [WEEKLY_APPROVAL_HEADER.format(week_number=week_number, year=year)]
+        parts.extend(
+            f"<b>{label}:</b>\n<pre>{_preview(scripts.get(key, 'N/A'), 200)}</pre>"
+            for key, label in WEEKLY_SECTIONS
+        )
+        parts.append(WEEKLY_APPROVAL_FOOTER.format(thread_id=thread_id))
+        message = "\n\n".join(parts)
+
+        buttons = _render_keyboard(WEEKLY_APPROVAL_KEYBOARD, thread_id, "weekly", self.frontend_url)
 
         await self._send_message(
             text=message,
@@ -264,67 +551,84 @@ Scripts are ready for your review!
         error: str,
     ):
         """Send error notification."""
-        message = f"""
-<b>❌ Error Occurred</b>
-
-<b>Job ID:</b> <code>{job_id}</code>
-<b>Error:</b> {error[:500]}
-
-Please check the dashboard for details.
-"""
-        await self._send_message(text=message)
+        message = ERROR_TEMPLATE.format(job_id=job_id, error=_escape(error[:500]))
+        await self._enqueue(message)
+
+
+# Services behind the callbacks. Imported on first use: ondemand imports
+# this module, so a top-level import would be circular.
+def _pipeline():
+    from app.agents.pipeline import get_pipeline
+    return get_pipeline()
+
+
+def _ondemand():
+    from app.services.ondemand import get_ondemand_service
+    return get_ondemand_service()
+
+
+def _db():
+    from app.services.database import get_db_service
+    return get_db_service()
+
+
+# (action, job type) -> (handler taking the job id, response)
+CALLBACK_HANDLERS = {
+    ("approve_script", "weekly"): (
+        lambda job_id: _pipeline().approve_script(job_id, approved=True),
+        {"status": "approved", "message": "Generating video..."},
+    ),
+    ("reject_script", "weekly"): (
+        lambda job_id: _pipeline().approve_script(job_id, approved=False),
+        {"status": "rejected"},
+    ),
+    ("approve_video", "weekly"): (
+        lambda job_id: _pipeline().approve_video(job_id, approved=True),
+        {"status": "approved", "message": "Publishing..."},
+    ),
+    ("reject_video", "weekly"): (
+        lambda job_id: _pipeline().approve_video(job_id, approved=False),
+        {"status": "rejected"},
+    ),
+    ("approve_script", "on_demand"): (
+        lambda job_id: _ondemand().generate_videos(job_id),
+        {"status": "approved", "message": "Generating video..."},
+    ),
+    ("reject_script", "on_demand"): (
+        lambda job_id: _db().update_ondemand_status(job_id, "rejected"),
+        {"status": "rejected"},
+    ),
+    ("approve_video", "on_demand"): (
+        lambda job_id: _ondemand().publish_to_social(job_id),
+        {"status": "approved", "message": "Publishing..."},
+    ),
+    ("reject_video", "on_demand"): (
+        lambda job_id: _db().update_ondemand_status(job_id, "video_rejected"),
+        {"status": "rejected"},
+    ),
+    ("regenerate_video", "on_demand"): (
+        lambda job_id: _ondemand().generate_videos(job_id),
+        {"status": "regenerating"},
+    ),
+}
 
 
 # Webhook handler for Telegram callbacks
 async def handle_telegram_callback(callback_data: str) -> dict:
     """Handle Telegram inline button callbacks."""
-    parts = callback_data.split(":")
-    if len(parts) < 3:
+    match = CALLBACK_DATA_PATTERN.match(callback_data)
+    if not match:
         return {"error": "Invalid callback data"}
 
-    action, job_id, job_type = parts[0], parts[1], parts[2]
-
-    if job_type == "weekly":
-        from app.agents.pipeline import get_pipeline
-        pipeline = get_pipeline()
-
-        if action == "approve_script":
-            result = await pipeline.approve_script(job_id, approved=True)
-            return {"status": "approved", "message": "Generating video..."}
-        elif action == "reject_script":
-            result = await pipeline.approve_script(job_id, approved=False)
-            return {"status": "rejected"}
-        elif action == "approve_video":
-            result = await pipeline.approve_video(job_id, approved=True)
-            return {"status": "approved", "message": "Publishing..."}
-        elif action == "reject_video":
-            result = await pipeline.approve_video(job_id, approved=False)
-            return {"status": "rejected"}
-
-    elif job_type == "on_demand":
-        from app.services.ondemand import get_ondemand_service
-        from app.services.database import get_db_service
-
-        db = get_db_service()
-        ondemand = get_ondemand_service()
-
-        if action == "approve_script":
-            await ondemand.generate_videos(job_id)
-            return {"status": "approved", "message": "Generating video..."}
-        elif action == "reject_script":
-            await db.update_ondemand_status(job_id, "rejected")
-            return {"status": "rejected"}
-        elif action == "approve_video":
-            await ondemand.publish_to_social(job_id)
-            return {"status": "approved", "message": "Publishing..."}
-        elif action == "reject_video":
-            await db.update_ondemand_status(job_id, "video_rejected")
-            return {"status": "rejected"}
-        elif action == "regenerate_video":
-            await ondemand.generate_videos(job_id)
-            return {"status": "regenerating"}
-
-    return {"error": "Unknown action"}
+    action, job_id, job_type = match.group("action", "job_id", "job_type")
+
+    entry = CALLBACK_HANDLERS.get((action, job_type))
+    if entry is None:
+        return {"error": "Unknown action"}
+
+    handler, response = entry
+    await handler(job_id)
+    return dict(response)
 
 
 # Singleton
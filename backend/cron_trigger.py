@@ -17,20 +17,32 @@ import asyncio
 import argparse
 import sys
 from datetime import date
+from typing import Optional
 import httpx
 
 
-async def trigger_via_api(backend_url: str, week_number: int, year: int) -> dict:
-    """Trigger briefing via the API endpoint."""
-    url = f"{backend_url}/trigger-weekly-briefing"
+async def trigger_via_api(
+    backend_url: str,
+    week_number: int,
+    year: int,
+    client: Optional[httpx.AsyncClient] = None,
+) -> dict:
+    """Trigger briefing via the API endpoint.
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, timeout=30.0)
+    Pass ``client`` to reuse an existing connection pool; otherwise a
+    client is opened for this one request.
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=30.0) as own_client:
+            return await trigger_via_api(backend_url, week_number, year, own_client)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"API error: {response.status_code} - {response.text}")
+    url = f"{backend_url}/trigger-weekly-briefing"
+    response = await client.post(url, timeout=30.0)
+
+    if response.status_code == 200:
+        return response.json()
+    else:
+        raise Exception(f"API error: {response.status_code} - {response.text}")
 
 
 async def trigger_directly(week_number: int, year: int) -> dict:
@@ -1,17 +1,62 @@
 """Pytest configuration and fixtures."""
 
+import copy
 import pytest
-import asyncio
-from typing import Generator
+from datetime import datetime
+from types import MappingProxyType
 from unittest.mock import MagicMock, AsyncMock
 
-# Configure async tests
+
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def client():
+    """FastAPI test client shared by all API tests.
+
+    Not entered as a context manager, so the app lifespan (MCP server
+    startup and the like) does not run, as with the per-class clients
+    this replaces. The app is imported here rather than at module level
+    so test modules can install their import-time mocks first.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def _db_service_spec_mock():
+    """DatabaseService mock, specced once per module.
+
+    The spec makes the service's async methods AsyncMocks, so tests only
+    set return values.
+    """
+    from app.services.database import DatabaseService
+
+    return MagicMock(spec=DatabaseService)
+
+
+@pytest.fixture
+def db_service_mock(_db_service_spec_mock):
+    """DatabaseService mock, reset after each test."""
+    yield _db_service_spec_mock
+    _db_service_spec_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def rss_xml_single_item():
+    """Well-formed RSS feed with one item published now, shared by feed tests."""
+    pub_date = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <item>
+            <title>Test Article</title>
+            <description>Test content</description>
+            <link>https://example.com/article</link>
+            <pubDate>{pub_date}</pubDate>
+        </item>
+    </channel>
+</rss>
+"""
 
 
 @pytest.fixture
@@ -58,10 +103,10 @@ def mock_heygen():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_articles():
-    """Sample news articles for testing."""
-    return [
+    """Sample news articles for testing (read-only, shared by all tests)."""
+    return tuple(MappingProxyType(article) for article in [
         {
             "source_type": "rss",
             "source_name": "CNA",
@@ -86,13 +131,19 @@ def sample_articles():
             "url": "https://nitter.net/TechInAsia/status/123",
             "published_at": "2026-01-18T15:30:00Z",
         },
-    ]
+    ])
 
 
 @pytest.fixture
+def sample_articles_mut(sample_articles):
+    """Mutable copy of sample_articles for tests that modify it."""
+    return [copy.deepcopy(dict(article)) for article in sample_articles]
+
+
+@pytest.fixture(scope="session")
 def sample_state():
-    """Sample pipeline state for testing."""
-    return {
+    """Sample pipeline state for testing (read-only, shared by all tests)."""
+    return MappingProxyType({
         "week_number": 1,
         "year": 2026,
         "thread_id": "2026-W01",
@@ -114,4 +165,10 @@ def sample_state():
         "script_approved": None,
         "script_feedback": None,
         "video_approved": None,
-    }
+    })
+
+
+@pytest.fixture
+def sample_state_mut(sample_state):
+    """Mutable copy of sample_state for tests that modify it."""
+    return copy.deepcopy(dict(sample_state))
@@ -9,20 +9,12 @@ if "supabase" not in sys.modules:
     sys.modules["supabase"] = mock_supabase
     sys.modules["supabase.client"] = MagicMock()
 
-import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock, AsyncMock
-
-from app.main import app
+from unittest.mock import patch, MagicMock
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-
     def test_root_endpoint(self, client):
         """Test root endpoint returns app info."""
         response = client.get("/")
@@ -44,23 +36,17 @@ class TestHealthEndpoints:
 class TestDashboardAPI:
     """Tests for dashboard API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-
-    def test_get_dashboard_stats(self, client):
+    def test_get_dashboard_stats(self, client, db_service_mock):
         """Test dashboard stats endpoint."""
-        with patch('app.api.dashboard.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.get_dashboard_stats = AsyncMock(return_value={
-                "total_briefings": 5,
-                "completed_briefings": 3,
-                "pending_approvals": 1,
-                "total_videos": 3,
-                "total_posts": 12,
-            })
-            mock_db.return_value = mock_service
-
+        db_service_mock.get_dashboard_stats.return_value = {
+            "total_briefings": 5,
+            "completed_briefings": 3,
+            "pending_approvals": 1,
+            "total_videos": 3,
+            "total_posts": 12,
+        }
+
+        with patch('app.api.dashboard.get_db_service', return_value=db_service_mock):
             response = client.get("/api/v1/dashboard/stats")
 
             assert response.status_code == 200
@@ -68,13 +54,11 @@ class TestDashboardAPI:
             assert "total_briefings" in data
             assert "pending_approvals" in data
 
-    def test_get_weekly_summary(self, client):
+    def test_get_weekly_summary(self, client, db_service_mock):
         """Test weekly summary endpoint."""
-        with patch('app.api.dashboard.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.get_briefings_by_threads = AsyncMock(return_value=[])
-            mock_db.return_value = mock_service
+        db_service_mock.get_briefings_by_threads.return_value = []
 
+        with patch('app.api.dashboard.get_db_service', return_value=db_service_mock):
             response = client.get("/api/v1/dashboard/weekly-summary")
 
             assert response.status_code == 200
@@ -86,41 +70,31 @@ class TestDashboardAPI:
 class TestBriefingsAPI:
     """Tests for briefings API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-
-    def test_list_briefings_empty(self, client):
+    def test_list_briefings_empty(self, client, db_service_mock):
         """Test listing briefings when empty."""
-        with patch('app.api.briefings.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.list_briefings = AsyncMock(return_value=[])
-            mock_db.return_value = mock_service
+        db_service_mock.list_briefing_rows.return_value = []
 
+        with patch('app.api.briefings.get_db_service', return_value=db_service_mock):
             response = client.get("/api/v1/briefings/")
 
             assert response.status_code == 200
             assert response.json() == []
 
-    def test_create_briefing_duplicate(self, client):
+    def test_create_briefing_duplicate(self, client, db_service_mock):
         """Test creating duplicate briefing returns error."""
-        with patch('app.api.briefings.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.get_briefing_by_week = AsyncMock(return_value=MagicMock())
-            mock_db.return_value = mock_service
+        db_service_mock.get_briefing_by_week.return_value = MagicMock()
 
+        with patch('app.api.briefings.get_db_service', return_value=db_service_mock):
             response = client.post("/api/v1/briefings/")
 
             assert response.status_code == 400
             assert "already exists" in response.json()["detail"]
 
-    def test_get_briefing_not_found(self, client):
+    def test_get_briefing_not_found(self, client, db_service_mock):
         """Test getting non-existent briefing."""
-        with patch('app.api.briefings.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.get_briefing_by_thread = AsyncMock(return_value=None)
-            mock_db.return_value = mock_service
+        db_service_mock.get_briefing_by_thread.return_value = None
 
+        with patch('app.api.briefings.get_db_service', return_value=db_service_mock):
             response = client.get("/api/v1/briefings/2026-W99")
 
             assert response.status_code == 404
@@ -129,17 +103,11 @@ class TestBriefingsAPI:
 class TestApprovalsAPI:
     """Tests for approvals API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-
-    def test_get_pending_approvals(self, client):
+    def test_get_pending_approvals(self, client, db_service_mock):
         """Test getting pending approvals."""
-        with patch('app.api.approvals.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.get_pending_approvals = AsyncMock(return_value=[])
-            mock_db.return_value = mock_service
+        db_service_mock.get_pending_approvals.return_value = []
 
+        with patch('app.api.approvals.get_db_service', return_value=db_service_mock):
             response = client.get("/api/v1/approvals/pending")
 
             assert response.status_code == 200
@@ -147,13 +115,11 @@ class TestApprovalsAPI:
             assert "script_approvals" in data
             assert "video_approvals" in data
 
-    def test_approve_script_not_found(self, client):
+    def test_approve_script_not_found(self, client, db_service_mock):
         """Test approving script for non-existent briefing."""
-        with patch('app.api.approvals.get_db_service') as mock_db:
-            mock_service = MagicMock()
-            mock_service.get_briefing_by_thread = AsyncMock(return_value=None)
-            mock_db.return_value = mock_service
+        db_service_mock.get_briefing_by_thread.return_value = None
 
+        with patch('app.api.approvals.get_db_service', return_value=db_service_mock):
             response = client.post(
                 "/api/v1/approvals/script",
                 json={"thread_id": "2026-W99", "approved": True}
@@ -165,10 +131,6 @@ class TestApprovalsAPI:
 class TestSettingsAPI:
     """Tests for settings API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-
     def test_get_settings_status(self, client):
         """Test settings status endpoint."""
         response = client.get("/api/v1/settings/status")
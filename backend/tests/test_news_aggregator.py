@@ -1,84 +1,147 @@
 """Tests for news aggregator service."""
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from collections import Counter
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 
-from app.services.news_aggregator import NewsAggregatorService
+from app.services.news_aggregator import CachedFeed, NewsAggregatorService, feed_entries, parse_rss_feed
 
+# Nothing listens on port 1, so requests there fail to connect
+UNREACHABLE_URL = "http://127.0.0.1:1/feed"
 
-class MockResponse:
-    """Mock for aiohttp response context manager."""
-    def __init__(self, status, text_content=""):
-        self.status = status
-        self._text_content = text_content
 
-    async def text(self):
-        return self._text_content
+@pytest.fixture
+async def feed_server(rss_xml_single_item):
+    """Local HTTP server serving canned feeds.
 
-    async def __aenter__(self):
-        return self
+    /good revalidates against ETag "v1", /broken always fails, /large
+    streams a body without Content-Length and /nitter-*/{user}/rss are
+    Nitter instances, of which only /nitter-up answers. Requests per path
+    are counted in ``server.hits``.
+    """
+    hits = Counter()
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        pass
+    async def good(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=rss_xml_single_item, headers={"ETag": '"v1"'})
+
+    async def broken(request):
+        return web.Response(status=500)
+
+    async def large(request):
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for _ in range(4):
+            await response.write(b"x" * 1024)
+        await response.write_eof()
+        return response
+
+    async def nitter(request):
+        if request.match_info["instance"] != "up":
+            return web.Response(status=500)
+        return web.Response(text=rss_xml_single_item)
+
+    @web.middleware
+    async def count_hits(request, handler):
+        hits[request.path] += 1
+        return await handler(request)
+
+    app = web.Application(middlewares=[count_hits])
+    app.router.add_get("/good", good)
+    app.router.add_get("/broken", broken)
+    app.router.add_get("/large", large)
+    app.router.add_get("/nitter-{instance}/{user}/rss", nitter)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits
+    yield server
+    await server.close()
 
 
 class TestNewsAggregatorService:
     """Tests for NewsAggregatorService."""
 
     @pytest.fixture
-    def aggregator(self):
+    async def aggregator(self):
         """Create aggregator instance."""
-        return NewsAggregatorService()
+        aggregator = NewsAggregatorService()
+        yield aggregator
+        await aggregator.close()
 
-    @pytest.mark.asyncio
-    async def test_fetch_rss_feeds_success(self, aggregator):
+    async def test_fetch_rss_feeds_success(self, aggregator, feed_server):
         """Test successful RSS feed fetching."""
-        # Use a recent date so it's not filtered out
-        pub_date = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
-        xml_content = f"""
-            <?xml version="1.0" encoding="UTF-8"?>
-            <rss version="2.0">
-                <channel>
-                    <item>
-                        <title>Test Article</title>
-                        <description>Test content</description>
-                        <link>https://example.com/article</link>
-                        <pubDate>{pub_date}</pubDate>
-                    </item>
-                </channel>
-            </rss>
-        """
-
-        with patch.object(aggregator, '_get_session') as mock_session:
-            mock_client = MagicMock()
-            # Mock get to return a MockResponse which properly implements __aenter__
-            mock_client.get.return_value = MockResponse(200, xml_content)
-            mock_session.return_value = mock_client
-
+        feeds = {"Good": str(feed_server.make_url("/good")), "Broken": str(feed_server.make_url("/broken"))}
+        with patch.dict("app.services.news_aggregator.SEA_RSS_FEEDS", feeds, clear=True):
             articles = await aggregator.fetch_rss_feeds(days=7)
 
-            # Should have fetched articles
-            assert isinstance(articles, list)
-            assert len(articles) > 0
+        # The good feed's article comes through; the broken feed is skipped
+        assert [article.source_name for article in articles] == ["Good"]
+        assert articles[0].url == "https://example.com/article"
 
-    @pytest.mark.asyncio
-    async def test_fetch_rss_feeds_handles_errors(self, aggregator):
-        """Test RSS feed error handling."""
-        with patch.object(aggregator, '_get_session') as mock_session:
-            mock_client = MagicMock()
-            # .get() returns a context manager, causing error inside __aenter__
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__.side_effect = Exception("Network error")
-            mock_client.get.return_value = mock_ctx
+    async def test_fetch_feed_reuses_body_on_not_modified(self, aggregator, feed_server):
+        """Test conditional GET sends validators and reuses the cached body."""
+        session = await aggregator._get_session()
+        url = str(feed_server.make_url("/good"))
+
+        first = await aggregator._fetch_feed(session, url)
+        second = await aggregator._fetch_feed(session, url)
+
+        # The second request was answered with a 304 and the cached body
+        assert first is not None
+        assert second is first
+        assert feed_server.hits["/good"] == 2
+
+    async def test_fetch_feed_skips_body_over_limit(self, aggregator, feed_server):
+        """Test feeds without Content-Length are cut off at the size cap."""
+        session = await aggregator._get_session()
+
+        with patch("app.services.news_aggregator.MAX_FEED_BYTES", 2048):
+            assert await aggregator._fetch_feed(session, str(feed_server.make_url("/large"))) is None
 
-            mock_session.return_value = mock_client
+    async def test_parse_feed_reuses_articles_for_unchanged_body(self, aggregator):
+        """Test an unchanged cached body is not parsed again."""
+        url = "https://example.com/feed"
+        body = b"<rss></rss>"
+        aggregator._feed_cache[url] = CachedFeed('"v1"', None, body)
+        article = MagicMock(published_at=datetime.utcnow())
+        cutoff = datetime.utcnow() - timedelta(days=7)
 
+        with patch.object(aggregator, '_run_cpu_bound', new_callable=AsyncMock) as mock_parse:
+            mock_parse.return_value = [article]
+            assert await aggregator._parse_feed(url, body, cutoff, MagicMock()) == [article]
+            assert await aggregator._parse_feed(url, body, cutoff, MagicMock()) == [article]
+
+            mock_parse.assert_called_once()
+
+            # A wider window than the cached parse covers needs a fresh parse
+            await aggregator._parse_feed(url, body, cutoff - timedelta(days=1), MagicMock())
+            assert mock_parse.call_count == 2
+
+    def test_parse_rss_feed_drops_entries_before_cutoff(self):
+        """Test old entries are dropped while parsing."""
+        content = b"""<rss><channel>
+            <item><title>New</title><pubDate>Tue, 20 Jan 2026 10:00:00 GMT</pubDate></item>
+            <item><title>Old</title><pubDate>Tue, 06 Jan 2026 10:00:00 GMT</pubDate></item>
+            <item><title>Undated</title></item>
+        </channel></rss>"""
+
+        articles = parse_rss_feed(content, "Test Source", datetime(2026, 1, 13))
+
+        assert [article.title for article in articles] == ["New", "Undated"]
+
+    async def test_fetch_rss_feeds_handles_errors(self, aggregator):
+        """Test RSS feed error handling."""
+        with patch.dict("app.services.news_aggregator.SEA_RSS_FEEDS", {"Down": UNREACHABLE_URL}, clear=True):
             # Should not raise, just return empty list
             articles = await aggregator.fetch_rss_feeds(days=7)
             assert articles == []
 
-    @pytest.mark.asyncio
     async def test_aggregate_all(self, aggregator):
         """Test aggregate_all combines multiple sources."""
         with patch.object(aggregator, 'fetch_rss_feeds', new_callable=AsyncMock) as mock_rss:
@@ -101,6 +164,7 @@ class TestNewsAggregatorService:
         assert "World" in clean
         assert "<p>" not in clean
         assert "<script>" not in clean
+        assert "evil()" not in clean
 
     def test_clean_html_empty(self, aggregator):
         """Test HTML cleaning with empty input."""
@@ -123,7 +187,49 @@ class TestNewsAggregatorService:
         assert aggregator._parse_date("") is None
         assert aggregator._parse_date(None) is None
 
-    @pytest.mark.asyncio
+    def test_feed_entries_reads_atom_up_to_limit(self):
+        """Test well-formed feeds are read incrementally up to the limit."""
+        entries = "".join(
+            f"""<entry>
+                <title>Entry {i}</title>
+                <link rel="self" href="https://example.com/self/{i}"/>
+                <link href="https://example.com/{i}"/>
+                <updated>2026-01-20T10:00:00+08:00</updated>
+            </entry>"""
+            for i in range(5)
+        )
+        content = f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()
+
+        result = feed_entries(content, 3)
+
+        assert [entry.title for entry in result] == ["Entry 0", "Entry 1", "Entry 2"]
+        assert result[0].link == "https://example.com/0"
+        assert result[0].published == datetime(2026, 1, 20, 2, 0, 0)
+
+    def test_feed_entries_sniffs_json_and_html(self):
+        """Test JSON feeds are read and HTML pages are skipped."""
+        content = b"""{"version": "https://jsonfeed.org/version/1.1", "items": [
+            {"title": "Entry", "url": "https://example.com/1",
+             "date_published": "2026-01-20T10:00:00+08:00"}
+        ]}"""
+
+        result = feed_entries(content, 5)
+
+        assert [entry.link for entry in result] == ["https://example.com/1"]
+        assert result[0].published == datetime(2026, 1, 20, 2, 0, 0)
+        assert feed_entries(b"<!DOCTYPE html><html><body>Rate limited</body></html>", 5) == []
+
+    def test_entry_published_prefers_parsed(self, aggregator):
+        """Test feedparser's parsed time is used before the raw string."""
+        entry = {
+            "published_parsed": (2026, 1, 20, 10, 0, 0, 1, 20, 0),
+            "published": "not a date",
+        }
+        assert aggregator._entry_published(entry) == datetime(2026, 1, 20, 10, 0, 0)
+
+        fallback = {"published": "Mon, 20 Jan 2026 10:00:00 GMT"}
+        assert aggregator._entry_published(fallback) == datetime(2026, 1, 20, 10, 0, 0)
+
     async def test_close(self, aggregator):
         """Test session cleanup."""
         # Create a session
@@ -132,41 +238,27 @@ class TestNewsAggregatorService:
 
         # Close it
         await aggregator.close()
-        # Session should be closed
+        # Session should be released so the next call builds a fresh one
+        assert aggregator.session is None
 
 
 class TestNitterIntegration:
     """Tests for Nitter/Twitter integration."""
 
     @pytest.fixture
-    def aggregator(self):
-        return NewsAggregatorService()
+    async def aggregator(self):
+        aggregator = NewsAggregatorService()
+        yield aggregator
+        await aggregator.close()
 
-    @pytest.mark.asyncio
-    async def test_fetch_nitter_feeds_tries_multiple_instances(self, aggregator):
+    async def test_fetch_nitter_feeds_tries_multiple_instances(self, aggregator, feed_server):
         """Test Nitter fallback to multiple instances."""
-        call_count = 0
-
-        def mock_get(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            # First two fail (status 500)
-            if call_count <= 2:
-                return MockResponse(500)
-            # Third succeeds
-            return MockResponse(200, "<rss><channel><item><title>Tweet</title></item></channel></rss>")
-
-        with patch.object(aggregator, '_get_session') as mock_session:
-            # We use MagicMock for client because get() is synchronous returning a context manager
-            mock_client = MagicMock()
-            mock_client.get.side_effect = mock_get
-
-            # _get_session is async, so it returns the client when awaited
-            mock_session.return_value = mock_client
+        instances = [str(feed_server.make_url(f"/nitter-{name}")) for name in ("down", "flaky", "up")]
 
+        with patch("app.services.news_aggregator.NITTER_INSTANCES", instances), \
+                patch("app.services.news_aggregator.TWITTER_ACCOUNTS", ["maya"]):
             articles = await aggregator.fetch_nitter_feeds(days=7)
 
-            # Should have tried multiple instances
-            assert call_count >= 1
-            # Should have found at least one article if parsing worked
-            # (assuming feedparser works with the string)
+        # Failed instances are skipped in favour of one that answered
+        assert feed_server.hits["/nitter-up/maya/rss"] == 1
+        assert [article.source_name for article in articles] == ["@maya"]
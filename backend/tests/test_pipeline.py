@@ -1,32 +1,52 @@
 """Tests for Maya pipeline."""
 
 import sys
+import types
 from unittest.mock import MagicMock
 
-# Mock supabase to prevent connection attempts during import
-# This is necessary because some modules might trigger Supabase client creation
-mock_supabase = MagicMock()
-sys.modules["supabase"] = mock_supabase
-sys.modules["supabase.client"] = MagicMock()
+# Stub supabase to prevent connection attempts during import. A bare module
+# with only the names the app imports, rather than a MagicMock that creates
+# attributes on every access
+_SUPABASE_STUB = types.ModuleType("supabase")
+_SUPABASE_STUB.create_client = MagicMock()
+_SUPABASE_STUB.Client = MagicMock
+sys.modules["supabase"] = _SUPABASE_STUB
+sys.modules["supabase.client"] = _SUPABASE_STUB
 
 import pytest
 from unittest.mock import AsyncMock, patch
+from app.agents.nodes import _parse_categories
 from app.agents.pipeline import MayaPipeline
+from app.integrations.blotato import BlotatoClient
+from app.integrations.heygen import HeyGenClient
 from app.models.schemas import PipelineStatus, NewsArticle
+from app.services.notification import NotificationService
 from datetime import datetime
 
+
+@pytest.fixture(autouse=True)
+def _reset_service_mocks(request):
+    """Reset call records on the module-scoped mocks after each test."""
+    yield
+    for name in ("mock_db", "mock_aggregator", "mock_llm", "mock_notification",
+                 "mock_heygen", "mock_blotato"):
+        if name in request.fixturenames:
+            request.getfixturevalue(name).reset_mock()
+
+
 class TestMayaPipelineIntegration:
-    """Integration tests for MayaPipeline."""
-
-    @pytest.fixture
-    def mock_db(self):
-        with patch('app.agents.pipeline.get_db_service') as mock:
-            mock.return_value.create_briefing = AsyncMock()
-            mock.return_value.update_briefing = AsyncMock()
-            mock.return_value.get_briefing_by_thread = AsyncMock()
+    """Integration tests for MayaPipeline.
+
+    The service patches are module-scoped: they hold no per-test state
+    beyond call records, which are reset after each test.
+    """
+
+    @pytest.fixture(scope="module")
+    def mock_db(self, _db_service_spec_mock):
+        with patch('app.agents.pipeline.get_db_service', return_value=_db_service_spec_mock) as mock:
             yield mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_aggregator(self):
         with patch('app.agents.nodes.get_news_aggregator') as mock:
             # Return some dummy articles to trigger categorization
@@ -41,40 +61,40 @@ class TestMayaPipelineIntegration:
             mock.return_value.aggregate_all = AsyncMock(return_value=[article])
             yield mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_llm(self):
         with patch('app.agents.nodes.get_llm') as mock:
             mock_llm_instance = AsyncMock()
             # Mock invoke to return a message-like object
             mock_msg = MagicMock()
-            mock_msg.content = "local" # Default category response
+            mock_msg.content = '["business"]' # Batch category response
             mock_llm_instance.ainvoke.return_value = mock_msg
             mock.return_value = mock_llm_instance
             yield mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_notification(self):
-        with patch('app.agents.nodes.get_notification_service') as mock:
-            mock.return_value.send_script_approval_request = AsyncMock()
-            mock.return_value.send_video_approval_request = AsyncMock()
+        with patch('app.agents.nodes.get_notification_service',
+                   return_value=MagicMock(spec=NotificationService)) as mock:
             yield mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_heygen(self):
-        with patch('app.agents.nodes.get_heygen_client') as mock:
-            mock.return_value.generate_video = AsyncMock(return_value={"video_id": "vid_123"})
-            mock.return_value.wait_for_video = AsyncMock(
-                return_value={"video_url": "http://video.com/1.mp4", "duration": 60}
-            )
+        with patch('app.agents.nodes.get_heygen_client',
+                   return_value=MagicMock(spec=HeyGenClient)) as mock:
+            mock.return_value.generate_video.return_value = {"video_id": "vid_123"}
+            mock.return_value.wait_for_video.return_value = {
+                "video_url": "http://video.com/1.mp4", "duration": 60
+            }
             yield mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_blotato(self):
-        with patch('app.agents.nodes.get_blotato_client') as mock:
-            mock.return_value.schedule_multi_platform = AsyncMock(return_value=[])
+        with patch('app.agents.nodes.get_blotato_client',
+                   return_value=MagicMock(spec=BlotatoClient)) as mock:
+            mock.return_value.schedule_multi_platform.return_value = []
             yield mock
 
-    @pytest.mark.asyncio
     async def test_start_briefing_flow(
         self, mock_db, mock_aggregator, mock_llm, mock_notification, mock_heygen, mock_blotato
     ):
@@ -92,7 +112,7 @@ class TestMayaPipelineIntegration:
         mock_aggregator.return_value.aggregate_all.assert_called_once()
 
         # Verify LLM was called
-        # 1. Categorize (1 article)
+        # 1. Categorize (1 article, one batch)
         # 2. Synthesize Local
         # 3. Synthesize Business
         # 4. Synthesize AI
@@ -100,6 +120,11 @@ class TestMayaPipelineIntegration:
         # Total = 5
         assert mock_llm.return_value.ainvoke.call_count >= 5
 
+        # The batch categorization response put the article in business
+        state = await pipeline.get_state(result["thread_id"])
+        assert [a["title"] for a in state["business_news"]] == ["Test Article"]
+        assert state["local_news"] == []
+
         # Verify notifications
         mock_notification.return_value.send_script_approval_request.assert_called_once()
         mock_notification.return_value.send_video_approval_request.assert_called_once()
@@ -109,3 +134,22 @@ class TestMayaPipelineIntegration:
 
         # Verify publishing
         mock_blotato.return_value.schedule_multi_platform.assert_called_once()
+
+
+class TestParseCategories:
+    """Tests for reading batch categorization responses."""
+
+    def test_reads_fenced_array(self):
+        """Test an array wrapped in a code fence is read."""
+        text = '```json\n["Business", " ai_tech "]\n```'
+        assert _parse_categories(text, 2) == ["business", "ai_tech"]
+
+    def test_pads_short_array_with_local(self):
+        """Test missing entries default to local."""
+        assert _parse_categories('["business"]', 3) == ["business", "local", "local"]
+
+    def test_garbage_defaults_to_local(self):
+        """Test unreadable responses default every entry to local."""
+        assert _parse_categories("I cannot categorize these.", 2) == ["local", "local"]
+        assert _parse_categories('[oops', 1) == ["local"]
+        assert _parse_categories('{"category": "business"}', 1) == ["local"]
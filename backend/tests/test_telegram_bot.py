@@ -0,0 +1,112 @@
+"""Tests for Telegram bot service."""
+
+import asyncio
+import logging
+import re
+from html.parser import HTMLParser
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from app.services.telegram_bot import (
+    TELEGRAM_CAPTION_LIMIT,
+    TelegramBot,
+    _split_html,
+)
+
+# A caption well over the caption limit, dense with tags and entities
+LONG_CAPTION = " ".join(
+    f"<b>Story {i}</b> <a href='https://example.com/{i}'>Read &amp; share</a> <i>AT&amp;T update</i>"
+    for i in range(40)
+)
+
+
+def assert_valid_html(text: str):
+    """Fail if tags in text are unbalanced or a tag or entity was cut."""
+    stack = []
+
+    class Checker(HTMLParser):
+        def handle_starttag(self, tag, attrs):
+            stack.append(tag)
+
+        def handle_endtag(self, tag):
+            assert stack and stack.pop() == tag, f"unbalanced </{tag}> in {text!r}"
+
+    Checker(convert_charrefs=False).feed(text)
+    assert not stack, f"unclosed {stack} in {text!r}"
+    assert not re.search(r"<[^>]*$", text), f"cut tag in {text!r}"
+    assert not re.search(r"&\w*$", text), f"cut entity in {text!r}"
+
+
+class TestSplitHtml:
+    """Tests for cutting HTML messages to Telegram's limits."""
+
+    def test_short_text_is_unchanged(self):
+        assert _split_html("<b>hi</b>", 100) == ("<b>hi</b>", "")
+
+    def test_tags_open_at_cut_are_closed_and_reopened(self):
+        head, rest = _split_html("<b>bold words here</b> after", 17)
+
+        assert head == "<b>bold words</b>"
+        assert rest == "<b>here</b> after"
+
+    def test_long_markup_parts_stay_valid(self):
+        rest = LONG_CAPTION
+        parts = []
+        while rest:
+            head, rest = _split_html(rest, 200)
+            parts.append(head)
+
+        assert len(parts) > 1
+        for part in parts:
+            assert len(part) <= 200
+            assert_valid_html(part)
+
+    def test_never_cuts_inside_an_entity(self):
+        head, rest = _split_html("x" * 10 + "&amp;" + "y" * 10, 12)
+
+        assert head == "x" * 10
+        assert rest.startswith("&amp;")
+
+
+class TestSendVideo:
+    """Tests for sending videos with long captions."""
+
+    async def test_long_caption_with_markup_is_sent_in_valid_parts(self):
+        bot = TelegramBot()
+        bot.token, bot.chat_id = "token", "chat"
+        post = AsyncMock(return_value={"ok": True, "result": {"message_id": 7}})
+
+        with patch.object(bot, "_post", post):
+            await bot._send_video("https://example.com/video.mp4", LONG_CAPTION)
+
+        video_payload = post.call_args_list[0].args[1]
+        replies = [call.args[1] for call in post.call_args_list[1:]]
+        assert len(video_payload["caption"]) <= TELEGRAM_CAPTION_LIMIT
+        assert_valid_html(video_payload["caption"])
+        assert replies
+        for reply in replies:
+            assert reply["reply_to_message_id"] == 7
+            assert_valid_html(reply["text"])
+
+
+class TestNotifications:
+    """Tests for coalesced notifications sent in the background."""
+
+    async def test_background_flush_failure_is_logged(self, caplog):
+        bot = TelegramBot()
+        bot.token, bot.chat_id = "token", "chat"
+        post = AsyncMock(side_effect=httpx.ConnectError("unreachable"))
+
+        with patch.object(bot, "_post", post), \
+                patch("app.services.telegram_bot.NOTIFICATION_COALESCE_SECONDS", 0), \
+                caplog.at_level(logging.ERROR, logger="app.services.telegram_bot"):
+            await bot._enqueue("first")
+            await bot._enqueue("second")
+            assert len(bot._flush_tasks) == 1
+            await asyncio.gather(*bot._flush_tasks)
+
+        post.assert_awaited_once()
+        assert post.call_args.args[1]["text"] == "first\n\nsecond"
+        assert "Failed to send queued Telegram notifications" in caplog.text
+        assert not bot._flush_tasks
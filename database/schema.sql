@@ -694,3 +694,92 @@ FROM agent_cost_logs
 WHERE created_at >= NOW() - INTERVAL '30 days'
 GROUP BY agent_id
 ORDER BY total_cost_usd DESC;
+
+-- ==================
+-- Query Performance Indexes
+-- ==================
+
+-- weekly_briefings.thread_id and social_posts.video_id are already covered by
+-- the UNIQUE constraint and idx_posts_video above.
+
+-- get_video_by_briefing filters on briefing_id and orders by newest first
+CREATE INDEX IF NOT EXISTS idx_videos_briefing_created ON weekly_videos(briefing_id, created_at DESC);
+DROP INDEX IF EXISTS idx_videos_briefing;
+
+-- get_pending_approvals only ever reads briefings awaiting a decision
+CREATE INDEX IF NOT EXISTS idx_briefings_pending ON weekly_briefings(created_at DESC)
+    WHERE status IN ('awaiting_script_approval', 'awaiting_video_approval');
+
+-- list_briefings pages by (created_at, id) so ties at a page boundary are kept
+CREATE INDEX IF NOT EXISTS idx_briefings_created_id ON weekly_briefings(created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_briefings_created;
+
+-- Briefing counts per status for get_dashboard_stats (called via RPC)
+CREATE OR REPLACE FUNCTION briefing_status_counts()
+RETURNS TABLE(status VARCHAR, count BIGINT) AS $$
+    SELECT status, COUNT(*) FROM weekly_briefings GROUP BY status;
+$$ LANGUAGE sql STABLE;
+
+-- Skip no-op UPDATEs (no WAL entry, no trigger cascade) when status polling
+-- re-sends values that are already stored. Named z_* so it fires last.
+CREATE TRIGGER z_weekly_briefings_suppress_redundant
+    BEFORE UPDATE ON weekly_briefings
+    FOR EACH ROW
+    EXECUTE FUNCTION suppress_redundant_updates_trigger();
+
+CREATE TRIGGER z_weekly_videos_suppress_redundant
+    BEFORE UPDATE ON weekly_videos
+    FOR EACH ROW
+    EXECUTE FUNCTION suppress_redundant_updates_trigger();
+
+-- Publish weekly_videos changes for DatabaseService.subscribe_video_updates
+CREATE OR REPLACE FUNCTION notify_video_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('video_updates', row_to_json(NEW)::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER weekly_videos_notify_update
+    AFTER UPDATE ON weekly_videos
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_video_update();
+
+-- ==================
+-- Editorial System - Scoring Batches
+-- ==================
+
+-- OpenAI Batch API jobs submitted by auto-score aggregation
+CREATE TABLE IF NOT EXISTS editorial_batches (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    batch_id VARCHAR(100) UNIQUE NOT NULL,
+    input_file_id VARCHAR(100),
+    story_ids JSONB DEFAULT '[]',
+    status VARCHAR(50) DEFAULT 'validating',  -- OpenAI batch status
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    completed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_editorial_batches_status ON editorial_batches(status);
+
+-- Write editorial scores for many raw stories in one statement (called via RPC).
+-- scores: [{"id": uuid, "score": number, "rank": text, "reason": text}, ...]
+CREATE OR REPLACE FUNCTION apply_story_scores(scores JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated INTEGER;
+BEGIN
+    UPDATE raw_stories rs
+    SET status = 'ranked',
+        score = (s->>'score')::DECIMAL,
+        rank = s->>'rank',
+        rank_reason = s->>'reason',
+        reviewed_at = NOW()
+    FROM jsonb_array_elements(scores) AS s
+    WHERE rs.id = (s->>'id')::UUID;
+
+    GET DIAGNOSTICS updated = ROW_COUNT;
+    RETURN updated;
+END;
+$$ LANGUAGE plpgsql;
@@ -86,11 +86,12 @@ export async function getSourcesStatus(): Promise<NewsSource[]> {
 // Briefings
 export async function listBriefings(params?: {
   limit?: number
-  offset?: number
+  after?: string
   status?: string
-}): Promise<Briefing[]> {
-  const { data } = await api.get('/briefings/', { params })
-  return data
+}): Promise<{ briefings: Briefing[]; nextCursor: string | null }> {
+  const { data, headers } = await api.get('/briefings/', { params })
+  // Pass nextCursor back as `after` to fetch the following page
+  return { briefings: data, nextCursor: headers['x-next-cursor'] ?? null }
 }
 
 export async function getBriefing(threadId: string) {
@@ -15,6 +15,7 @@ export default function Analytics() {
   const { data: briefings } = useQuery({
     queryKey: ['all-briefings'],
     queryFn: () => listBriefings({ limit: 100 }),
+    select: (page) => page.briefings,
   })
 
   // Calculate stats
@@ -11,6 +11,7 @@ export default function Briefings() {
   const { data: briefings, isLoading, refetch } = useQuery({
     queryKey: ['briefings'],
     queryFn: () => listBriefings({ limit: 50 }),
+    select: (page) => page.briefings,
   })
 
   const handleCreateBriefing = async () => {